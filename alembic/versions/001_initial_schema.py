@@ -43,10 +43,14 @@ def upgrade() -> None:
         sa.UniqueConstraint("key_prefix"),
         sa.UniqueConstraint("client_id", "name", name="uq_api_keys_client_id_name"),
     )
-    op.create_index("ix_api_keys_client_id", "api_keys", ["client_id"])
-    op.create_index("ix_api_keys_is_active", "api_keys", ["is_active"])
-    op.create_index("ix_api_keys_key_prefix", "api_keys", ["key_prefix"])
-    op.create_index("ix_api_keys_expires_at", "api_keys", ["expires_at"])
+    # Batch index creation into one round trip per table; the revision
+    # already runs inside a single transaction on Postgres
+    op.execute(
+        "CREATE INDEX ix_api_keys_client_id ON api_keys (client_id); "
+        "CREATE INDEX ix_api_keys_is_active ON api_keys (is_active); "
+        "CREATE INDEX ix_api_keys_key_prefix ON api_keys (key_prefix); "
+        "CREATE INDEX ix_api_keys_expires_at ON api_keys (expires_at)"
+    )
 
     # Create items table
     op.create_table(
@@ -68,18 +72,21 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index("ix_items_name", "items", ["name"])
-    op.create_index("ix_items_created_at", "items", ["created_at"])
+    op.execute(
+        "CREATE INDEX ix_items_name ON items (name); "
+        "CREATE INDEX ix_items_created_at ON items (created_at)"
+    )
 
 
 def downgrade() -> None:
     """Drop api_keys and items tables."""
-    op.drop_index("ix_items_created_at", table_name="items")
-    op.drop_index("ix_items_name", table_name="items")
+    op.execute("DROP INDEX ix_items_created_at; DROP INDEX ix_items_name")
     op.drop_table("items")
 
-    op.drop_index("ix_api_keys_expires_at", table_name="api_keys")
-    op.drop_index("ix_api_keys_key_prefix", table_name="api_keys")
-    op.drop_index("ix_api_keys_is_active", table_name="api_keys")
-    op.drop_index("ix_api_keys_client_id", table_name="api_keys")
+    op.execute(
+        "DROP INDEX ix_api_keys_expires_at; "
+        "DROP INDEX ix_api_keys_key_prefix; "
+        "DROP INDEX ix_api_keys_is_active; "
+        "DROP INDEX ix_api_keys_client_id"
+    )
     op.drop_table("api_keys")
@@ -0,0 +1,40 @@
+"""Replace the is_active index with a partial (key_prefix WHERE is_active) index.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-08-26
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Swap the low-cardinality is_active index for a partial prefix index.
+
+    validate_key filters on key_prefix AND is_active; the partial unique
+    index answers both predicates with a single index probe, and dropping
+    the single-column is_active index removes its write amplification on
+    every revoke.
+    """
+    op.execute(
+        "DROP INDEX ix_api_keys_is_active; "
+        "CREATE UNIQUE INDEX ix_api_keys_prefix_active "
+        "ON api_keys (key_prefix) WHERE is_active"
+    )
+
+
+def downgrade() -> None:
+    """Restore the single-column is_active index."""
+    op.execute(
+        "DROP INDEX ix_api_keys_prefix_active; "
+        "CREATE INDEX ix_api_keys_is_active ON api_keys (is_active)"
+    )
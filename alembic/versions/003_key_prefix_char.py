@@ -0,0 +1,39 @@
+"""Tighten api_keys.key_prefix from VARCHAR(12) to CHAR(12).
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-08-26
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert key_prefix to fixed-width CHAR(12).
+
+    Prefixes are always exactly 12 ASCII characters, so the fixed-width type
+    drops the per-value length header and packs more entries per index page.
+    Equality uses the same bpchar operator class, and the USING cast is a
+    no-op rewrite for existing 12-character values.
+    """
+    op.execute(
+        "ALTER TABLE api_keys "
+        "ALTER COLUMN key_prefix TYPE char(12) USING key_prefix::char(12)"
+    )
+
+
+def downgrade() -> None:
+    """Restore key_prefix to VARCHAR(12)."""
+    op.execute(
+        "ALTER TABLE api_keys "
+        "ALTER COLUMN key_prefix TYPE varchar(12) USING key_prefix::varchar(12)"
+    )
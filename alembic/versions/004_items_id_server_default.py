@@ -0,0 +1,38 @@
+"""Add server-side UUID default on items.id.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-08-26
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Let Postgres generate item IDs with gen_random_uuid().
+
+    Built in since PostgreSQL 13. Covers writers that bypass SQLAlchemy
+    (raw SQL, bulk COPY); ORM/Core inserts keep applying the model's
+    Python-side uuid4 default, which the mapped column retains for SQLite
+    tests and for reading ids before flush.
+    """
+    op.alter_column(
+        "items",
+        "id",
+        server_default=sa.text("gen_random_uuid()"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the server-side default (IDs revert to client-generated)."""
+    op.alter_column("items", "id", server_default=None)
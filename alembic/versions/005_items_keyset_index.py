@@ -0,0 +1,31 @@
+"""Composite index for item keyset pagination.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-08-26
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index (created_at, id) so keyset pages are a single range scan.
+
+    The DESC listing order is served by a backward scan of this ascending
+    index, so no DESC index is required.
+    """
+    op.create_index("ix_items_created_id", "items", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index."""
+    op.drop_index("ix_items_created_id", table_name="items")
@@ -2,6 +2,6 @@
 
 from app.auth.dependencies import RequireAPIKey, get_api_key
 from app.auth.models import APIKey
-from app.auth.service import APIKeyService
+from app.auth.service import APIKeyAuth, APIKeyService
 
-__all__ = ["APIKey", "APIKeyService", "RequireAPIKey", "get_api_key"]
+__all__ = ["APIKey", "APIKeyAuth", "APIKeyService", "RequireAPIKey", "get_api_key"]
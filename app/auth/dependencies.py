@@ -1,25 +1,56 @@
 """FastAPI dependencies for API key authentication."""
 
+from functools import cached_property
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, Security, status
+from fastapi.openapi.models import APIKey as APIKeyModel, APIKeyIn
 from fastapi.security import APIKeyHeader
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.models import APIKey
-from app.auth.service import APIKeyService
-from app.config.settings import get_settings
+from app.auth.service import APIKeyAuth, APIKeyService
+from app.config.settings import Settings, get_settings
 from app.db.session import get_db
 
-# Default API key header name - can be overridden by settings at runtime
-_DEFAULT_API_KEY_HEADER = "X-API-Key"
 
-# API key header security scheme - uses default, but validation uses settings
-api_key_header = APIKeyHeader(
-    name=_DEFAULT_API_KEY_HEADER,
-    auto_error=False,
-    description="API key for authentication",
-)
+async def get_settings_dep() -> Settings:
+    """Settings as an async dependency.
+
+    FastAPI caches the resolved value for the request scope, and the async
+    wrapper keeps resolution off the sync-dependency threadpool.
+    """
+    return get_settings()
+
+
+class _LazyAPIKeyHeader(APIKeyHeader):
+    """API key header scheme whose name is resolved from settings on first use.
+
+    FastAPI needs the scheme instance when routes are declared, but reading
+    settings at import time would construct Settings as a side effect of
+    importing anything under ``app.auth`` (breaking CLI-only entry points
+    that run without a DATABASE_URL) and force the deferred Settings schema
+    build. FastAPI only touches ``model`` per request and when generating
+    the OpenAPI schema, so building it lazily keeps this module import-safe.
+    """
+
+    def __init__(self) -> None:
+        # Deliberately not calling super().__init__: it builds the model
+        # eagerly, which is exactly the settings read being deferred
+        self.scheme_name = "APIKeyHeader"
+        self.auto_error = False
+
+    @cached_property
+    def model(self) -> APIKeyModel:  # type: ignore[override]
+        return APIKeyModel(
+            # Dict unpack for the aliased "in" field, as fastapi.security
+            # does itself; mypy cannot type the unpack
+            **{"in": APIKeyIn.header},  # type: ignore[arg-type]
+            name=get_settings().api_key_header,
+            description="API key for authentication",
+        )
+
+
+api_key_header = _LazyAPIKeyHeader()
 
 
 # Unified error message to prevent user enumeration attacks
@@ -29,15 +60,17 @@ _INVALID_API_KEY_MESSAGE = "Invalid API key"
 async def get_api_key(
     api_key: Annotated[str | None, Security(api_key_header)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> APIKey:
+    settings: Annotated[Settings, Depends(get_settings_dep)],
+) -> APIKeyAuth:
     """Validate API key and return the key record.
 
     Args:
         api_key: The API key from the request header.
         db: The database session.
+        settings: The application settings.
 
     Returns:
-        The validated APIKey record.
+        A lightweight APIKeyAuth snapshot of the validated key.
 
     Raises:
         HTTPException: If the API key is missing or invalid.
@@ -46,8 +79,6 @@ async def get_api_key(
         Uses a unified error message for all auth failures to prevent
         user enumeration attacks.
     """
-    settings = get_settings()
-
     # Use unified error message for all auth failures
     if not api_key:
         raise HTTPException(
@@ -76,4 +107,4 @@ async def get_api_key(
 
 
 # Type alias for dependency injection - use this in route functions
-RequireAPIKey = Annotated[APIKey, Depends(get_api_key)]
+RequireAPIKey = Annotated[APIKeyAuth, Depends(get_api_key)]
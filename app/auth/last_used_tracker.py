@@ -0,0 +1,99 @@
+"""Batched background updates for APIKey.last_used_at.
+
+Writing last_used_at synchronously on every authenticated request costs an
+extra round trip and a row write-lock on the hottest table. Timestamp
+freshness does not need per-request precision, so validate_key records usage
+in memory via mark() and a background task started from the application
+lifespan coalesces pending IDs into a single batched UPDATE every flush
+interval.
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import UTC, datetime
+
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.models import APIKey
+
+logger = logging.getLogger(__name__)
+
+# Flush cadence and per-flush batch bound for the background worker
+FLUSH_INTERVAL_SECONDS = 0.25
+MAX_BATCH_SIZE = 500
+
+
+class LastUsedTracker:
+    """Coalesces last_used_at writes into periodic batched UPDATEs."""
+
+    def __init__(self) -> None:
+        self._pending: set[str] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    def mark(self, key_id: str) -> None:
+        """Record that a key was used (non-blocking, in-memory only)."""
+        self._pending.add(key_id)
+
+    async def flush(self, db: AsyncSession) -> int:
+        """Write up to MAX_BATCH_SIZE pending IDs in a single UPDATE.
+
+        Args:
+            db: The database session to flush with.
+
+        Returns:
+            The number of key IDs written.
+        """
+        if not self._pending:
+            return 0
+
+        batch = [
+            self._pending.pop() for _ in range(min(len(self._pending), MAX_BATCH_SIZE))
+        ]
+        await db.execute(
+            update(APIKey)
+            .where(APIKey.id.in_(batch))
+            .values(last_used_at=datetime.now(UTC))
+        )
+        await db.commit()
+        return len(batch)
+
+    def start(self) -> None:
+        """Start the background flush task (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and flush any remaining IDs."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        try:
+            await self._flush_with_new_session()
+        except SQLAlchemyError as e:
+            logger.warning("Final last_used_at flush failed: %s", e)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            try:
+                await self._flush_with_new_session()
+            except SQLAlchemyError as e:
+                # Usage timestamps are best-effort; keep the worker alive
+                logger.warning("last_used_at batch flush failed: %s", e)
+
+    async def _flush_with_new_session(self) -> None:
+        if not self._pending:
+            return
+        from app.db.session import get_session_factory
+
+        async with get_session_factory()() as db:
+            await self.flush(db)
+
+
+# Process-wide tracker instance; started/stopped by the application lifespan
+last_used_tracker = LastUsedTracker()
@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import CHAR, Boolean, DateTime, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,6 +14,16 @@ class APIKey(Base):
     """Model for storing API keys."""
 
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # Partial index serving the validate_key lookup
+        # (key_prefix = ? AND is_active) with a single probe
+        Index(
+            "ix_api_keys_prefix_active",
+            "key_prefix",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -35,10 +45,12 @@ class APIKey(Base):
         String(255),
         nullable=False,
         unique=True,
-        comment="Bcrypt hash of the API key",
+        comment="HMAC-SHA256 hash of the API key (legacy rows use bcrypt)",
     )
     key_prefix: Mapped[str] = mapped_column(
-        String(12),
+        # Fixed-width CHAR: prefixes are always exactly 12 ASCII chars, and
+        # dropping the varlena length header packs more entries per index page
+        CHAR(12),
         nullable=False,
         unique=True,
         index=True,
@@ -48,7 +60,6 @@ class APIKey(Base):
         Boolean,
         default=True,
         nullable=False,
-        index=True,
     )
     expires_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
@@ -58,6 +69,9 @@ class APIKey(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        # Python-side default alongside the server default: every column is
+        # populated at flush, so callers never need a refresh round trip
+        default=lambda: datetime.now(UTC),
         server_default=func.now(),
         nullable=False,
     )
@@ -1,13 +1,34 @@
-"""API key service for key management and validation."""
+"""API key service for key management and validation.
 
+Timing-attack hardening
+-----------------------
+
+All secret-bearing comparisons in this module are constant-time:
+
+- bcrypt.checkpw is constant-time internally for hash verification.
+- ``hmac.compare_digest`` is the constant-time primitive for any direct
+  digest/string comparison.
+- When no key row matches the prefix lookup, a dummy bcrypt verification
+  runs anyway so the "key not found" and "hash mismatch" paths take the
+  same time, preventing prefix-existence enumeration via response timing.
+"""
+
+import asyncio
+import hashlib
+import hmac
 import logging
 import secrets
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from uuid import UUID
 
 import bcrypt
-from sqlalchemy import func, select, update
+from sqlalchemy import func, insert, or_, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.last_used_tracker import last_used_tracker
 from app.auth.models import APIKey
 from app.auth.schemas import APIKeyCreate, APIKeyCreated
 from app.config.settings import get_settings
@@ -21,11 +42,146 @@ def _get_correlation_id() -> str:
     return correlation_id_var.get() or "unknown"
 
 
+@dataclass(slots=True)
+class APIKeyAuth:
+    """Lightweight snapshot of an API key for the auth hot path.
+
+    validate_key only needs a handful of columns for the auth decision;
+    fetching them as a plain row and wrapping them in this dataclass avoids
+    full ORM hydration (identity map, attribute instrumentation) on every
+    request. Callers that need the complete record use get_key_by_id.
+    """
+
+    id: str
+    key_hash: str
+    client_id: str
+    is_active: bool
+    expires_at: datetime | None
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if the API key has expired."""
+        if self.expires_at is None:
+            return False
+        return datetime.now(UTC) > self.expires_at
+
+
+class _ValidationCache:
+    """Size-bounded TTL cache for recently validated API keys.
+
+    Caching the validated row lets the hot auth path skip both the database
+    lookup and the bcrypt comparison for repeat requests with the same key.
+    Entries expire after ``ttl`` seconds, so revocations made by another
+    process converge within one TTL window; in-process revocations are
+    invalidated immediately.
+
+    All operations are plain dict manipulations executed on the event loop
+    thread, so no locking is required.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: dict[bytes, tuple[float, APIKeyAuth]] = {}
+
+    def get(self, cache_key: bytes) -> APIKeyAuth | None:
+        """Return the cached key record, or None if absent or expired."""
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, api_key = entry
+        if time.monotonic() > expires_at:
+            del self._entries[cache_key]
+            return None
+        return api_key
+
+    def set(self, cache_key: bytes, api_key: APIKeyAuth) -> None:
+        """Cache a validated key record, evicting the oldest entry if full."""
+        if self._ttl <= 0:
+            return
+        if cache_key not in self._entries and len(self._entries) >= self._maxsize:
+            # Insertion order approximates LRU closely enough for this cache
+            del self._entries[next(iter(self._entries))]
+        self._entries[cache_key] = (time.monotonic() + self._ttl, api_key)
+
+    def invalidate_key_id(self, key_id: str) -> None:
+        """Remove any cached entries for the given key ID."""
+        stale = [k for k, (_, v) in self._entries.items() if v.id == key_id]
+        for cache_key in stale:
+            del self._entries[cache_key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+def _auth_snapshot(api_key: APIKey) -> APIKeyAuth:
+    """Build an auth snapshot from a full ORM row (e.g. after creation)."""
+    return APIKeyAuth(
+        id=str(api_key.id),
+        key_hash=api_key.key_hash,
+        client_id=api_key.client_id,
+        is_active=api_key.is_active,
+        expires_at=api_key.expires_at,
+    )
+
+
+def _get_pepper_bytes() -> bytes:
+    """Get the encoded pepper (settings are immutable once loaded)."""
+    global _pepper_bytes  # noqa: PLW0603 - lazy singleton init
+    if _pepper_bytes is None:
+        _pepper_bytes = get_settings().api_key_pepper.encode()
+    return _pepper_bytes
+
+
+_pepper_bytes: bytes | None = None
+
+
+def _make_cache_key(key: bytes) -> bytes:
+    """Derive the cache key for a raw API key via HMAC-SHA256 with the pepper.
+
+    The raw key is never stored; HMAC with the server-side pepper prevents
+    recovering keys from a memory dump of the cache.
+    """
+    return hmac.new(_get_pepper_bytes(), key, hashlib.sha256).digest()
+
+
+def _get_validation_cache() -> _ValidationCache:
+    """Get the process-wide validation cache (lazily sized from settings)."""
+    global _validation_cache  # noqa: PLW0603 - lazy singleton init
+    if _validation_cache is None:
+        settings = get_settings()
+        _validation_cache = _ValidationCache(
+            maxsize=settings.api_key_cache_max_size,
+            ttl=settings.api_key_cache_ttl,
+        )
+    return _validation_cache
+
+
+_validation_cache: _ValidationCache | None = None
+
+
+def _get_dummy_hash() -> str:
+    """Get the hash used to equalize timing when no key row matches.
+
+    Produced by the current KDF so a dummy verification costs the same as
+    a real one.
+    """
+    global _dummy_hash  # noqa: PLW0603 - lazy singleton init
+    if _dummy_hash is None:
+        _dummy_hash = APIKeyService.hash_key("dummy-key-for-timing-equalization")
+    return _dummy_hash
+
+
+_dummy_hash: str | None = None
+
+
 class APIKeyService:
     """Service class for API key operations."""
 
     KEY_PREFIX = "sk_"
     KEY_LENGTH = 32
+    PREFIX_LENGTH = 12
 
     @staticmethod
     def generate_key() -> str:
@@ -39,34 +195,55 @@ class APIKeyService:
 
     @staticmethod
     def hash_key(key: str) -> str:
-        """Hash an API key using bcrypt.
+        """Hash an API key using HMAC-SHA256 with the server-side pepper.
 
-        Uses configurable bcrypt rounds from settings for security tuning.
+        Generated keys carry 256 bits of entropy from secrets.token_urlsafe,
+        so a single peppered HMAC gives equivalent offline brute-force
+        resistance to a slow KDF at a tiny fraction of the CPU cost. Bcrypt
+        is only appropriate for low-entropy user-chosen passwords; legacy
+        bcrypt hashes are still accepted by verify_key.
 
         Args:
             key: The plaintext API key.
 
         Returns:
-            The bcrypt hash of the key.
+            The hex HMAC-SHA256 digest of the key.
         """
-        settings = get_settings()
-        salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
-        hashed: bytes = bcrypt.hashpw(key.encode(), salt)
-        return hashed.decode()
+        return APIKeyService._hash_key_bytes(key.encode())
+
+    @staticmethod
+    def _hash_key_bytes(key: bytes) -> str:
+        """Hash an already-encoded API key.
+
+        Hot paths encode the key once and pass bytes through the call chain
+        to avoid repeated str.encode() allocations per request.
+        """
+        return hmac.new(_get_pepper_bytes(), key, hashlib.sha256).hexdigest()
 
     @staticmethod
     def verify_key(key: str, key_hash: str) -> bool:
-        """Verify an API key against its hash.
+        """Verify an API key against its stored hash.
+
+        Supports both the current HMAC-SHA256 format and legacy bcrypt
+        hashes (identified by their ``$2`` prefix).
 
         Args:
             key: The plaintext API key.
-            key_hash: The stored bcrypt hash.
+            key_hash: The stored hash (HMAC-SHA256 hex or legacy bcrypt).
 
         Returns:
             True if the key matches the hash.
         """
-        result: bool = bcrypt.checkpw(key.encode(), key_hash.encode())
-        return result
+        return APIKeyService._verify_key_bytes(key.encode(), key_hash)
+
+    @staticmethod
+    def _verify_key_bytes(key: bytes, key_hash: str) -> bool:
+        """Verify an already-encoded API key against its stored hash."""
+        if key_hash.startswith("$2"):
+            # Legacy bcrypt row (pre-HMAC); constant-time internally
+            result: bool = bcrypt.checkpw(key, key_hash.encode())
+            return result
+        return hmac.compare_digest(APIKeyService._hash_key_bytes(key), key_hash)
 
     @staticmethod
     def get_key_prefix(key: str) -> str:
@@ -78,7 +255,7 @@ class APIKeyService:
         Returns:
             The first 12 characters of the key.
         """
-        return key[:12]
+        return key[: APIKeyService.PREFIX_LENGTH]
 
     @staticmethod
     async def create_key(db: AsyncSession, data: APIKeyCreate) -> APIKeyCreated:
@@ -92,21 +269,33 @@ class APIKeyService:
             The created key info including the raw key (only shown once).
         """
         raw_key = APIKeyService.generate_key()
+        # hash_key is a single HMAC-SHA256 (microseconds), so it runs inline;
+        # a slow KDF here would need asyncio.to_thread to avoid stalling the
+        # event loop for concurrent requests
         key_hash = APIKeyService.hash_key(raw_key)
         key_prefix = APIKeyService.get_key_prefix(raw_key)
 
-        api_key = APIKey(
-            name=data.name,
-            client_id=data.client_id,
-            key_hash=key_hash,
-            key_prefix=key_prefix,
-            is_active=True,
-            expires_at=data.expires_at,
+        # INSERT ... RETURNING folds the insert and the server-default
+        # readback (created_at) into a single round trip; no refresh needed
+        result = await db.execute(
+            insert(APIKey)
+            .values(
+                name=data.name,
+                client_id=data.client_id,
+                key_hash=key_hash,
+                key_prefix=key_prefix,
+                is_active=True,
+                expires_at=data.expires_at,
+            )
+            .returning(APIKey)
         )
+        api_key = result.scalar_one()
 
-        db.add(api_key)
-        await db.flush()
-        await db.refresh(api_key)
+        # Pre-warm the validation cache so the first request with this key
+        # skips the bcrypt verification
+        _get_validation_cache().set(
+            _make_cache_key(raw_key.encode()), _auth_snapshot(api_key)
+        )
 
         logger.info(
             "Created API key",
@@ -130,51 +319,115 @@ class APIKeyService:
         )
 
     @staticmethod
-    async def validate_key(db: AsyncSession, key: str) -> APIKey | None:
-        """Validate an API key and update last_used_at atomically.
+    async def validate_key(db: AsyncSession, key: str) -> APIKeyAuth | None:
+        """Validate an API key and record its usage.
 
-        Uses SELECT FOR UPDATE to prevent race conditions when updating
-        the last_used_at timestamp. Also checks for key expiration.
+        Checks the in-memory validation cache first; a hit skips both the
+        database lookup and the hash comparison. Usage is recorded via the
+        last-used tracker, which batches last_used_at writes in the
+        background instead of issuing one per request. Also checks for key
+        expiration.
 
         Args:
             db: The database session.
             key: The plaintext API key to validate.
 
         Returns:
-            The APIKey record if valid, None otherwise.
+            An APIKeyAuth snapshot if valid, None otherwise.
         """
         # Use key prefix for O(1) lookup (unique constraint ensures single match)
         prefix = APIKeyService.get_key_prefix(key)
         correlation_id = _get_correlation_id()
 
-        # Use SELECT FOR UPDATE to lock the row during validation
-        # This prevents race conditions when multiple requests validate the same key
+        # Encode once; the cache key, hash verification, and legacy rehash
+        # below all consume the byte form
+        key_bytes = key.encode()
+
+        # Fast path: recently validated key (re-check liveness on every hit)
+        cache_key = _make_cache_key(key_bytes)
+        cached = _get_validation_cache().get(cache_key)
+        if cached is not None and cached.is_active and not cached.is_expired:
+            last_used_tracker.mark(cached.id)
+            logger.debug(
+                "API key validated from cache",
+                extra={
+                    "key_id": cached.id,
+                    "key_prefix": prefix,
+                    "correlation_id": correlation_id,
+                },
+            )
+            return cached
+
+        # Column select skips full ORM hydration; only the fields needed for
+        # the auth decision are fetched
         result = await db.execute(
-            select(APIKey)
-            .where(
+            select(
+                APIKey.id,
+                APIKey.key_hash,
+                APIKey.client_id,
+                APIKey.is_active,
+                APIKey.expires_at,
+            ).where(
                 APIKey.is_active == True,  # noqa: E712
                 APIKey.key_prefix == prefix,
+                # Filter expired keys in SQL so they never reach the hash
+                # verification below
+                or_(APIKey.expires_at.is_(None), APIKey.expires_at > func.now()),
             )
-            .with_for_update(skip_locked=True)
         )
 
-        api_key = result.scalar_one_or_none()
-        if api_key is None:
+        row = result.first()
+        if row is None:
+            # Burn a verification so this path takes the same time as the
+            # hash-mismatch path (prevents prefix-existence enumeration)
+            APIKeyService._verify_key_bytes(key_bytes, _get_dummy_hash())
             logger.warning(
                 "API key validation failed: key not found or inactive",
                 extra={"key_prefix": prefix, "correlation_id": correlation_id},
             )
             return None
 
-        # Verify the key hash
-        if not APIKeyService.verify_key(key, api_key.key_hash):
+        api_key = APIKeyAuth(
+            id=str(row.id),
+            key_hash=row.key_hash,
+            client_id=row.client_id,
+            is_active=row.is_active,
+            expires_at=row.expires_at,
+        )
+
+        # Verify the key hash. The HMAC comparison is microseconds and runs
+        # inline; legacy bcrypt takes ~100ms and releases the GIL, so it goes
+        # through asyncio.to_thread to keep the event loop serving other
+        # requests for the duration.
+        if api_key.key_hash.startswith("$2"):
+            verified = await asyncio.to_thread(
+                APIKeyService._verify_key_bytes, key_bytes, api_key.key_hash
+            )
+        else:
+            verified = APIKeyService._verify_key_bytes(key_bytes, api_key.key_hash)
+        if not verified:
             logger.warning(
                 "API key validation failed: hash mismatch",
                 extra={"key_prefix": prefix, "correlation_id": correlation_id},
             )
             return None
 
-        # Check if key has expired
+        # Lazily migrate legacy bcrypt rows to the HMAC format on successful
+        # verification (we only have the plaintext key at this point)
+        if api_key.key_hash.startswith("$2"):
+            api_key.key_hash = APIKeyService._hash_key_bytes(key_bytes)
+            await db.execute(
+                update(APIKey)
+                .where(APIKey.id == api_key.id)
+                .values(key_hash=api_key.key_hash)
+            )
+            logger.info(
+                "Rehashed legacy bcrypt API key",
+                extra={"key_id": api_key.id, "key_prefix": prefix},
+            )
+
+        # Defense in depth: the SQL predicate already excludes expired keys,
+        # so this should never trigger
         if api_key.is_expired:
             logger.warning(
                 "API key validation failed: key expired",
@@ -186,14 +439,16 @@ class APIKeyService:
             )
             return None
 
-        # Update last_used_at atomically (row is already locked)
-        api_key.last_used_at = datetime.now(UTC)
-        await db.flush()
+        # Record usage; the tracker batches last_used_at writes in the
+        # background so the validation path stays read-only
+        last_used_tracker.mark(api_key.id)
+
+        _get_validation_cache().set(cache_key, api_key)
 
         logger.debug(
             "API key validated successfully",
             extra={
-                "key_id": str(api_key.id),
+                "key_id": api_key.id,
                 "key_prefix": prefix,
                 "client_id": api_key.client_id,
                 "correlation_id": correlation_id,
@@ -219,37 +474,171 @@ class APIKeyService:
     MIN_PREFIX_LENGTH = 4
 
     @staticmethod
-    async def get_key_by_prefix(db: AsyncSession, prefix: str) -> APIKey | None:
-        """Get an API key by its prefix.
+    async def get_key_by_exact_prefix(db: AsyncSession, prefix: str) -> APIKey | None:
+        """Get an API key by its full 12-character prefix.
+
+        Equality on the uniquely indexed column gives a single-row index
+        probe instead of the range scan a LIKE/startswith search needs.
 
         Args:
             db: The database session.
-            prefix: The key prefix (minimum 4 characters).
+            prefix: The full key prefix (exactly 12 characters).
 
         Returns:
-            The APIKey record if found, None if prefix too short or not found.
+            The APIKey record if found.
+        """
+        result = await db.execute(select(APIKey).where(APIKey.key_prefix == prefix))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def search_keys_by_prefix(
+        db: AsyncSession,
+        partial: str,
+        limit: int = 10,
+    ) -> list[APIKey]:
+        """Search API keys whose prefix starts with a partial prefix.
+
+        Args:
+            db: The database session.
+            partial: The partial prefix (minimum 4 characters).
+            limit: Maximum number of matches to return.
+
+        Returns:
+            Matching APIKey records, empty if the partial is too short.
         """
         # Require minimum prefix length to prevent overly broad searches
-        if len(prefix) < APIKeyService.MIN_PREFIX_LENGTH:
+        if len(partial) < APIKeyService.MIN_PREFIX_LENGTH:
             logger.warning(
                 "Key prefix search rejected: too short",
                 extra={
-                    "prefix_length": len(prefix),
+                    "prefix_length": len(partial),
                     "min_required": APIKeyService.MIN_PREFIX_LENGTH,
                 },
             )
-            return None
+            return []
 
         result = await db.execute(
-            select(APIKey).where(APIKey.key_prefix.startswith(prefix))
+            select(APIKey).where(APIKey.key_prefix.startswith(partial)).limit(limit)
         )
-        return result.scalar_one_or_none()
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_key_by_prefix(db: AsyncSession, prefix: str) -> APIKey | None:
+        """Get an API key by its prefix (exact probe first, then search).
+
+        Args:
+            db: The database session.
+            prefix: The key prefix (minimum 4 characters).
+
+        Returns:
+            The APIKey record if exactly one matches, None if the prefix is
+            too short, not found, or ambiguous.
+        """
+        if len(prefix) == APIKeyService.PREFIX_LENGTH:
+            return await APIKeyService.get_key_by_exact_prefix(db, prefix)
+
+        matches = await APIKeyService.search_keys_by_prefix(db, prefix, limit=2)
+        if len(matches) == 1:
+            return matches[0]
+        return None
+
+    @staticmethod
+    async def get_key_by_prefix_or_id(db: AsyncSession, token: str) -> APIKey | None:
+        """Resolve an API key from a prefix or ID in a single query.
+
+        CLI commands accept either form; probing both candidates with one
+        OR query avoids the second round trip of a prefix-then-ID fallback.
+        The ID branch is only included when the token parses as a UUID, so
+        Postgres never sees an invalid uuid cast.
+
+        Args:
+            db: The database session.
+            token: A full 12-character prefix, a partial prefix, or a key ID.
+
+        Returns:
+            The APIKey record if exactly one matches.
+        """
+        conditions = []
+        if len(token) == APIKeyService.PREFIX_LENGTH:
+            conditions.append(APIKey.key_prefix == token)
+        try:
+            UUID(token)
+        except ValueError:
+            pass
+        else:
+            conditions.append(APIKey.id == token)
+
+        if conditions:
+            result = await db.execute(select(APIKey).where(or_(*conditions)))
+            return result.scalars().first()
+
+        # Partial prefixes need a range scan, not an equality probe
+        return await APIKeyService.get_key_by_prefix(db, token)
+
+    @staticmethod
+    async def count_keys(db: AsyncSession, exact: bool = False) -> int:
+        """Count API keys, preferring a planner estimate on Postgres.
+
+        COUNT(*) scans the whole table; for listing purposes the
+        pg_class.reltuples estimate is accurate enough and O(1). The exact
+        count is used when requested or on non-Postgres backends.
+
+        Args:
+            db: The database session.
+            exact: Force an exact COUNT(*) instead of the estimate.
+
+        Returns:
+            The (possibly estimated) number of keys.
+        """
+        if not exact and db.get_bind().dialect.name == "postgresql":
+            result = await db.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = 'api_keys'"
+                )
+            )
+            estimate = result.scalar()
+            # reltuples is -1 until the table has been analyzed at least once
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        count_result = await db.execute(select(func.count(APIKey.id)))
+        return count_result.scalar() or 0
+
+    @staticmethod
+    async def stream_keys(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> AsyncIterator[APIKey]:
+        """Stream API keys with a server-side cursor.
+
+        Rows arrive in yield_per-sized batches, so memory stays O(batch)
+        regardless of the requested limit.
+
+        Args:
+            db: The database session.
+            skip: Number of records to skip.
+            limit: Maximum number of records to yield.
+
+        Yields:
+            APIKey records ordered by creation time, newest first.
+        """
+        result = await db.stream_scalars(
+            select(APIKey)
+            .order_by(APIKey.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=100)
+        )
+        async for key in result:
+            yield key
 
     @staticmethod
     async def list_keys(
         db: AsyncSession,
         skip: int = 0,
         limit: int = 50,
+        exact_total: bool = False,
     ) -> tuple[list[APIKey], int]:
         """List all API keys.
 
@@ -257,20 +646,15 @@ class APIKeyService:
             db: The database session.
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            exact_total: Use an exact COUNT(*) instead of the estimate.
 
         Returns:
             A tuple of (list of keys, total count).
         """
-        # Get total count efficiently (doesn't load all rows)
-        count_result = await db.execute(select(func.count(APIKey.id)))
-        total = count_result.scalar() or 0
-
-        # Get paginated results
-        result = await db.execute(
-            select(APIKey).order_by(APIKey.created_at.desc()).offset(skip).limit(limit)
-        )
-        keys = list(result.scalars().all())
-
+        total = await APIKeyService.count_keys(db, exact=exact_total)
+        keys = [
+            key async for key in APIKeyService.stream_keys(db, skip=skip, limit=limit)
+        ]
         return keys, total
 
     @staticmethod
@@ -294,5 +678,6 @@ class APIKeyService:
         )
         rowcount: int = result.rowcount  # type: ignore[attr-defined]
         if rowcount > 0:
+            _get_validation_cache().invalidate_key_id(key_id)
             logger.info("Revoked API key", extra={"key_id": key_id})
         return rowcount > 0
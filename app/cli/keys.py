@@ -1,6 +1,7 @@
 """CLI commands for API key management."""
 
 import asyncio
+import atexit
 import selectors
 import sys
 from collections.abc import Coroutine
@@ -8,32 +9,51 @@ from typing import Any
 
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.auth.models import APIKey
 from app.auth.schemas import APIKeyCreate
 from app.auth.service import APIKeyService
-from app.db.session import get_session_factory
+from app.db.session import dispose_engine, get_session_factory
 
 console = Console()
 error_console = Console(stderr=True)
 
+# Shared CLI event loop, created on first use and closed at process exit.
+# Reusing one loop keeps the engine's connection pool alive across
+# subcommands, so multi-command scripts pay connection startup only once.
+_loop: asyncio.AbstractEventLoop | None = None
 
-def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
-    """Run an async coroutine synchronously.
 
-    On Windows, psycopg3 requires SelectorEventLoop instead of ProactorEventLoop.
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared CLI event loop (created once per process).
+
+    On Windows, psycopg3 requires SelectorEventLoop instead of
+    ProactorEventLoop.
     """
-    if sys.platform == "win32":
-        # psycopg3 on Windows requires SelectorEventLoop
-        selector = selectors.SelectSelector()
-        loop = asyncio.SelectorEventLoop(selector)
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
-    else:
-        return asyncio.run(coro)
+    global _loop  # noqa: PLW0603 - lazy singleton init
+    if _loop is None:
+        if sys.platform == "win32":
+            # psycopg3 on Windows requires SelectorEventLoop
+            _loop = asyncio.SelectorEventLoop(selectors.SelectSelector())
+        else:
+            _loop = asyncio.new_event_loop()
+        atexit.register(_close_event_loop)
+    return _loop
+
+
+def _close_event_loop() -> None:
+    """Dispose the engine pool and close the shared loop at process exit."""
+    if _loop is not None and not _loop.is_closed():
+        _loop.run_until_complete(dispose_engine())
+        _loop.close()
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run an async coroutine on the shared CLI event loop."""
+    return _get_event_loop().run_until_complete(coro)
 
 
 def handle_db_error(e: SQLAlchemyError) -> None:
@@ -80,6 +100,18 @@ def create_key(
     run_async(_create())
 
 
+def _key_table_row(key: APIKey) -> tuple[str, str, str, str, str, str]:
+    """Render one API key as a Rich table row."""
+    status = "[green]active[/green]" if key.is_active else "[red]revoked[/red]"
+    last_used = (
+        key.last_used_at.strftime("%Y-%m-%d %H:%M")
+        if key.last_used_at
+        else "[dim]never[/dim]"
+    )
+    created = key.created_at.strftime("%Y-%m-%d %H:%M")
+    return key.key_prefix, key.name, key.client_id, status, last_used, created
+
+
 @app.command("list")
 def list_keys(
     limit: int = typer.Option(50, "--limit", "-l", help="Maximum keys to show"),
@@ -89,9 +121,13 @@ def list_keys(
     async def _list() -> None:
         try:
             async with get_session_factory()() as db:
-                keys, total = await APIKeyService.list_keys(db, skip=0, limit=limit)
+                total = await APIKeyService.count_keys(db)
 
-                if not keys:
+                # Stream rows into the table as they arrive instead of
+                # materializing the full listing first
+                stream = APIKeyService.stream_keys(db, skip=0, limit=limit)
+                first = await anext(stream, None)
+                if first is None:
                     console.print("[yellow]No API keys found.[/yellow]")
                     return
 
@@ -103,29 +139,10 @@ def list_keys(
                 table.add_column("Last Used")
                 table.add_column("Created")
 
-                for key in keys:
-                    status = (
-                        "[green]active[/green]"
-                        if key.is_active
-                        else "[red]revoked[/red]"
-                    )
-                    last_used = (
-                        key.last_used_at.strftime("%Y-%m-%d %H:%M")
-                        if key.last_used_at
-                        else "[dim]never[/dim]"
-                    )
-                    created = key.created_at.strftime("%Y-%m-%d %H:%M")
-
-                    table.add_row(
-                        key.key_prefix,
-                        key.name,
-                        key.client_id,
-                        status,
-                        last_used,
-                        created,
-                    )
-
-                console.print(table)
+                with Live(table, console=console, refresh_per_second=10):
+                    table.add_row(*_key_table_row(first))
+                    async for key in stream:
+                        table.add_row(*_key_table_row(key))
         except SQLAlchemyError as e:
             handle_db_error(e)
 
@@ -142,12 +159,8 @@ def revoke_key(
     async def _revoke() -> None:
         try:
             async with get_session_factory()() as db:
-                # Try to find by prefix first
-                key = await APIKeyService.get_key_by_prefix(db, prefix)
-
-                if not key:
-                    # Try by ID
-                    key = await APIKeyService.get_key_by_id(db, prefix)
+                # Single query resolves either a prefix or an ID
+                key = await APIKeyService.get_key_by_prefix_or_id(db, prefix)
 
                 if not key:
                     console.print(
@@ -196,12 +209,8 @@ def key_info(
     async def _info() -> None:
         try:
             async with get_session_factory()() as db:
-                # Try to find by prefix first
-                key = await APIKeyService.get_key_by_prefix(db, prefix)
-
-                if not key:
-                    # Try by ID
-                    key = await APIKeyService.get_key_by_id(db, prefix)
+                # Single query resolves either a prefix or an ID
+                key = await APIKeyService.get_key_by_prefix_or_id(db, prefix)
 
                 if not key:
                     console.print(
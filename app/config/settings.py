@@ -1,6 +1,6 @@
 """Application settings using Pydantic Settings."""
 
-from functools import lru_cache
+from functools import cached_property
 
 from pydantic import PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -22,6 +22,10 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # Build the pydantic-core schema at first instantiation instead of
+        # import time; trims cold-start cost for CLI/tooling imports that
+        # never construct Settings
+        defer_build=True,
     )
 
     # Application
@@ -36,8 +40,15 @@ class Settings(BaseSettings):
     database_echo: bool = False
 
     # API Key settings
+    api_key_header: str = "X-API-Key"
     api_key_min_length: int = 32
     bcrypt_rounds: int = 12  # Bcrypt work factor (12-14 recommended for 2024+)
+    # Server-side pepper used to derive cache keys for validated API keys.
+    # Override in production so cache keys are not derivable from raw keys alone.
+    api_key_pepper: str = "dev-pepper-change-in-production"
+    # Validation cache tuning (set TTL to 0 to disable caching)
+    api_key_cache_ttl: float = 60.0
+    api_key_cache_max_size: int = 10_000
 
     # CORS settings
     # Empty = no CORS; use specific origins like ["https://example.com"]
@@ -50,6 +61,10 @@ class Settings(BaseSettings):
     # Timing/debug headers (disable in production to prevent timing attacks)
     expose_timing_header: bool = True
 
+    # Write the per-request log line directly to stdout, bypassing the
+    # logging machinery (fixed format; custom handlers/filters won't see it)
+    request_log_fast_path: bool = False
+
     # Database timeouts
     database_pool_timeout: int = 30  # Connection pool timeout in seconds
     database_statement_timeout: int = 30000  # Statement timeout in milliseconds
@@ -105,9 +120,9 @@ class Settings(BaseSettings):
             raise ValueError(msg)
         return v
 
-    @property
+    @cached_property
     def async_database_url(self) -> str:
-        """Get async database URL for psycopg3."""
+        """Get async database URL for psycopg3 (computed once per instance)."""
         url = str(self.database_url)
         if url.startswith("postgresql://"):
             return url.replace("postgresql://", "postgresql+psycopg://", 1)
@@ -116,7 +131,17 @@ class Settings(BaseSettings):
         return url
 
 
-@lru_cache
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings()
+    """Get cached application settings.
+
+    Backed by a plain module-level singleton rather than lru_cache: settings
+    never change after load, and the None check avoids lru_cache's argument
+    hashing and lock acquisition on every call.
+    """
+    global _settings  # noqa: PLW0603 - lazy singleton init
+    if _settings is None:
+        _settings = Settings()
+    return _settings
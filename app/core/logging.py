@@ -2,18 +2,63 @@
 
 import logging
 import sys
+import time
+from functools import cache
 from typing import Any
 
 from app.core.middleware import correlation_id_var
 
+# Bound method cached once; skips the ContextVar attribute resolution on
+# every log record
+_get_correlation_id = correlation_id_var.get
 
-class CorrelationIdFilter(logging.Filter):
-    """Logging filter that adds correlation ID to log records."""
+_record_factory_installed = False
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Add correlation_id to the log record."""
-        record.correlation_id = correlation_id_var.get("")
-        return True
+
+def _install_record_factory() -> None:
+    """Stamp correlation_id onto every LogRecord via the record factory.
+
+    A single factory hook replaces per-logger/per-handler Filter instances:
+    one function call per record instead of a filter-chain traversal on both
+    the logger and each handler, and no filter objects to attach or scan for.
+    """
+    global _record_factory_installed  # noqa: PLW0603 - install-once guard
+    if _record_factory_installed:
+        return
+    _record_factory_installed = True
+
+    original_factory = logging.getLogRecordFactory()
+
+    def _factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        record = original_factory(*args, **kwargs)
+        record.correlation_id = _get_correlation_id("")
+        return record
+
+    logging.setLogRecordFactory(_factory)
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the rendered timestamp within the same second.
+
+    %(asctime)s normally costs a localtime() plus strftime per record; the
+    configured format has second granularity, so records emitted in the same
+    second can share one rendered string.
+    """
+
+    _cached_second: int = -1
+    _cached_asctime: str = ""
+
+    def formatTime(  # noqa: N802 (stdlib API)
+        self, record: logging.LogRecord, datefmt: str | None = None
+    ) -> str:
+        """Render record time, memoized on the whole second."""
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_asctime = time.strftime(
+                datefmt or self.default_time_format, time.localtime(second)
+            )
+        return self._cached_asctime
 
 
 def setup_logging(log_level: str = "INFO") -> None:
@@ -22,8 +67,10 @@ def setup_logging(log_level: str = "INFO") -> None:
     Args:
         log_level: The logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
     """
+    _install_record_factory()
+
     # Create formatter with correlation ID
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         fmt="%(asctime)s | %(levelname)-8s | %(correlation_id)s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -40,7 +87,6 @@ def setup_logging(log_level: str = "INFO") -> None:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(CorrelationIdFilter())
     root_logger.addHandler(console_handler)
 
     # Set third-party loggers to WARNING to reduce noise
@@ -49,6 +95,7 @@ def setup_logging(log_level: str = "INFO") -> None:
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
+@cache
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name.
 
@@ -58,11 +105,9 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         A configured logger instance.
     """
-    logger = logging.getLogger(name)
-    # Ensure the correlation ID filter is added
-    if not any(isinstance(f, CorrelationIdFilter) for f in logger.filters):
-        logger.addFilter(CorrelationIdFilter())
-    return logger
+    # The record factory installed by setup_logging stamps correlation_id on
+    # every record, so no per-logger filter is needed here
+    return logging.getLogger(name)
 
 
 def log_with_context(
@@ -79,7 +124,16 @@ def log_with_context(
         message: The log message.
         **context: Additional context to include in the log.
     """
+    # Bail before any formatting when the level is filtered out, so disabled
+    # DEBUG call sites pay only the isEnabledFor check
+    if not logger.isEnabledFor(level):
+        return
     if context:
-        context_str = " | ".join(f"{k}={v}" for k, v in context.items())
-        message = f"{message} | {context_str}"
-    logger.log(level, message)
+        logger.log(
+            level,
+            "%s | %s",
+            message,
+            " | ".join(f"{k}={v}" for k, v in context.items()),
+        )
+    else:
+        logger.log(level, message)
@@ -1,87 +1,168 @@
 """Request middleware for logging and correlation IDs."""
 
 import logging
-import re
+import string
+import sys
 import time
 from contextvars import ContextVar
-from uuid import uuid4
+from os import urandom
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Context variable for correlation ID - accessible throughout the request lifecycle
 correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
 
-# Correlation ID validation: alphanumeric, hyphens, underscores only, max 64 chars
-_CORRELATION_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
+# Prebuilt {"X-Correlation-ID": cid} response-header dict for the current
+# request; exception handlers read it with one ContextVar lookup instead of
+# constructing the dict on every error response
+correlation_headers_var: ContextVar[dict[str, str] | None] = ContextVar(
+    "correlation_headers", default=None
+)
 
+# Correlation ID validation: alphanumeric, hyphens, underscores only, capped
+# length. The translate table deletes every allowed character, so a valid ID
+# translates to the empty string — one C-level call instead of a regex match
+# on the per-request path.
+_MAX_CORRELATION_ID_LENGTH = 64
+_CORRELATION_ID_DELETE_ALLOWED = str.maketrans(
+    dict.fromkeys(string.ascii_letters + string.digits + "_-")
+)
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
-    """Middleware that manages correlation IDs for request tracing."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Extract or generate correlation ID and add to response headers."""
-        # Get correlation ID from request header or generate a new one
-        client_correlation_id = request.headers.get("X-Correlation-ID")
+def _is_valid_correlation_id(cid: str) -> bool:
+    """Check that a client correlation ID is safe to echo into logs."""
+    return 1 <= len(cid) <= _MAX_CORRELATION_ID_LENGTH and not cid.translate(
+        _CORRELATION_ID_DELETE_ALLOWED
+    )
+
+
+# Header names as bytes, built once; ASGI header lists carry bytes pairs and
+# encoding these per request would be avoidable allocation
+_CID_HEADER = b"x-correlation-id"
+_PROCESS_TIME_HEADER = b"x-process-time"
+
 
-        # Validate client-provided correlation ID to prevent log injection
-        if client_correlation_id and _CORRELATION_ID_PATTERN.match(
-            client_correlation_id
-        ):
-            correlation_id = client_correlation_id
-        else:
-            correlation_id = str(uuid4())
+class CorrelationIdMiddleware:
+    """Middleware that manages correlation IDs for request tracing.
+
+    Implemented against the raw ASGI protocol rather than
+    BaseHTTPMiddleware, which spawns an anyio task group and streams the
+    body through memory channels for every request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Extract or generate correlation ID and add to response headers."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Get correlation ID from request header or generate a new one;
+        # validate client-provided IDs to prevent log injection. Generated
+        # IDs are 16 hex chars (64 bits) straight from urandom — plenty for
+        # request tracing, and cheaper than uuid4's UUID construction and
+        # formatting.
+        cid = None
+        for name, value in scope["headers"]:
+            if name == _CID_HEADER:
+                cid = value.decode("latin-1")
+                break
+        correlation_id = (
+            cid if cid and _is_valid_correlation_id(cid) else urandom(8).hex()
+        )
 
         correlation_id_var.set(correlation_id)
+        correlation_headers_var.set({"X-Correlation-ID": correlation_id})
+        cid_bytes = correlation_id.encode("ascii")
 
-        response = await call_next(request)
-        response.headers["X-Correlation-ID"] = correlation_id
-        return response
+        async def send_with_header(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = message.setdefault("headers", [])
+                # The exception handlers already stamp the ID (via
+                # correlation_headers_var); appending again would emit the
+                # header twice on error responses
+                if not any(name == _CID_HEADER for name, _ in headers):
+                    headers.append((_CID_HEADER, cid_bytes))
+            await send(message)
 
+        await self.app(scope, receive, send_with_header)
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware that logs request details and timing."""
+
+class RequestLoggingMiddleware:
+    """Middleware that logs request details and timing.
+
+    Pure ASGI for the same reason as CorrelationIdMiddleware: no
+    per-request task group or body streaming overhead. Timing and the log
+    line are produced when the response starts, wrapping ``send`` instead
+    of the whole request/response cycle.
+    """
 
     def __init__(
         self,
         app: ASGIApp,
         logger: logging.Logger | None = None,
         expose_timing: bool = True,
+        fast_log: bool = False,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.logger = logger or logging.getLogger("app.requests")
         self.expose_timing = expose_timing
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+        # Fast path writes the request line straight to stdout, skipping
+        # LogRecord construction, filter traversal, and Formatter dispatch;
+        # trade-off is a fixed format that handlers/filters never see
+        self.fast_log = fast_log
+        # Pre-bound methods save two attribute lookups per request
+        self._log_info = self.logger.info
+        self._is_enabled_for = self.logger.isEnabledFor
+        self._stdout_write = sys.stdout.write
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Log request details and processing time."""
-        start_time = time.perf_counter()
-
-        # Process the request
-        response = await call_next(request)
-
-        # Calculate processing time
-        process_time_ms = (time.perf_counter() - start_time) * 1000
-
-        # Log request details
-        self.logger.info(
-            "Request completed | method=%s | path=%s | status=%d | time=%.2fms",
-            request.method,
-            request.url.path,
-            response.status_code,
-            process_time_ms,
-        )
-
-        # Add timing header only if configured (disable in production to prevent timing attacks)
-        if self.expose_timing:
-            response.headers["X-Process-Time"] = f"{process_time_ms:.2f}ms"
-        return response
+        # Skip the clock reads and timing math entirely when nothing
+        # consumes the result (timing header off and INFO filtered out)
+        log_enabled = self._is_enabled_for(logging.INFO)
+        if scope["type"] != "http" or not (self.expose_timing or log_enabled):
+            await self.app(scope, receive, send)
+            return
+
+        perf_counter = time.perf_counter
+        start_time = perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time
+                process_time_ms = (perf_counter() - start_time) * 1000
+                status_code: int = message["status"]
+
+                # Log request details. The log_enabled guard skips the
+                # formatting work entirely when INFO is filtered out
+                # (e.g. WARNING+ in production).
+                if log_enabled:
+                    if self.fast_log:
+                        self._stdout_write(
+                            f"{time.strftime('%Y-%m-%d %H:%M:%S')} | INFO     | "
+                            f"{correlation_id_var.get()} | app.requests | "
+                            f"Request completed | method={scope['method']} | "
+                            f"path={scope['path']} | status={status_code} | "
+                            f"time={process_time_ms:.2f}ms\n"
+                        )
+                    else:
+                        self._log_info(
+                            "Request completed | method=%s | path=%s | status=%d | time=%.2fms",
+                            scope["method"],
+                            scope["path"],
+                            status_code,
+                            process_time_ms,
+                        )
+
+                # Add timing header only if configured (disable in production
+                # to prevent timing attacks)
+                if self.expose_timing:
+                    message.setdefault("headers", []).append(
+                        (_PROCESS_TIME_HEADER, f"{process_time_ms:.2f}ms".encode())
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
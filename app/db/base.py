@@ -28,6 +28,10 @@ class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
+        # Python-side default (as updated_at already has) keeps the stored
+        # precision identical to comparison binds, which keyset-pagination
+        # cursors rely on
+        default=_utc_now,
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
@@ -44,11 +44,10 @@ Transaction Patterns
 
 import logging
 from collections.abc import AsyncGenerator
-from functools import lru_cache
 
-from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -60,45 +59,79 @@ from app.config.settings import get_settings
 logger = logging.getLogger(__name__)
 
 
-@lru_cache
+# Lazily initialized singletons; plain None checks avoid lru_cache's
+# argument hashing and lock acquisition on these per-request paths
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
 def get_engine() -> AsyncEngine:
     """Get the database engine (lazily initialized).
 
     Includes connection pool timeout and statement timeout configuration.
     """
+    global _engine  # noqa: PLW0603 - lazy singleton init
+    if _engine is not None:
+        return _engine
+
     settings = get_settings()
     engine = create_async_engine(
         settings.async_database_url,
         pool_size=settings.database_pool_size,
         max_overflow=settings.database_max_overflow,
         pool_timeout=settings.database_pool_timeout,
+        # Revalidate pooled connections on checkout so a restarted database
+        # surfaces as a transparent reconnect instead of a failed request
+        pool_pre_ping=True,
         echo=settings.database_echo,
+        connect_args={
+            # psycopg3 normally server-side prepares a statement only after it
+            # has executed prepare_threshold times on a connection; 0 prepares
+            # on first execution so hot-path queries skip the per-request
+            # parse/plan cost
+            "prepare_threshold": 0,
+            # statement_timeout rides along in the startup message instead of
+            # a SET round trip per new pooled connection. The value is a
+            # validated integer from settings, so the formatting is safe.
+            "options": f"-c statement_timeout={settings.database_statement_timeout}",
+        },
     )
 
-    # Set statement timeout on new connections (PostgreSQL-specific)
-    # Note: SET commands don't support parameterized queries in PostgreSQL.
-    # The value is an integer from validated settings, so string formatting is safe.
-    @event.listens_for(engine.sync_engine, "connect")
-    def set_statement_timeout(  # pyright: ignore[reportUnusedFunction]
-        dbapi_connection: object, connection_record: object
-    ) -> None:
-        cursor = dbapi_connection.cursor()  # type: ignore[attr-defined]
-        # SET doesn't support parameters, but value is validated integer from settings
-        cursor.execute(f"SET statement_timeout = {settings.database_statement_timeout}")
-        cursor.close()
-
+    _engine = engine
     return engine
 
 
-@lru_cache
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get the async session factory (lazily initialized)."""
-    return async_sessionmaker(
-        get_engine(),
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-    )
+    global _session_factory  # noqa: PLW0603 - lazy singleton init
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+    return _session_factory
+
+
+async def get_raw_conn() -> AsyncGenerator[AsyncConnection]:
+    """FastAPI dependency that provides a raw engine connection.
+
+    For cheap probes like readiness checks, a bare connection skips the
+    AsyncSession's identity-map and transaction-state setup that a
+    sessionmaker call pays on every request.
+    """
+    async with get_engine().connect() as conn:
+        yield conn
+
+
+async def dispose_engine() -> None:
+    """Dispose the engine's connection pool if one was created."""
+    global _engine, _session_factory  # noqa: PLW0603 - dispose resets the singletons
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+        _session_factory = None
 
 
 async def get_db() -> AsyncGenerator[AsyncSession]:
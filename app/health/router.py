@@ -5,12 +5,11 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Response, status
-from sqlalchemy import func, select
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from app.auth.models import APIKey
-from app.db.session import get_db_no_commit
+from app.db.session import get_raw_conn
 from app.health.schemas import HealthResponse, ReadinessResponse
 
 # Health check query timeout in seconds
@@ -20,6 +19,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+# Prebuilt responses for the happy paths; the models are frozen, so reusing
+# one instance across probes is safe and skips a pydantic validation on
+# every successful check
+_LIVE_OK = HealthResponse(status="ok")
+_READY_OK = ReadinessResponse(status="ok", checks={"database": "ok"})
+
 
 @router.get(
     "/live",
@@ -29,7 +34,7 @@ router = APIRouter(prefix="/health", tags=["health"])
 )
 async def liveness() -> HealthResponse:
     """Liveness probe - is the application running?"""
-    return HealthResponse(status="ok")
+    return _LIVE_OK
 
 
 @router.get(
@@ -44,41 +49,35 @@ async def liveness() -> HealthResponse:
 )
 async def readiness(
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_db_no_commit)],
+    conn: Annotated[AsyncConnection, Depends(get_raw_conn)],
 ) -> ReadinessResponse:
     """Readiness probe - is the application ready to serve traffic?
 
     Checks database connectivity and table access, returns overall status.
     Returns 503 if any check fails (for Kubernetes compatibility).
     """
-    checks: dict[str, str] = {}
-
-    # Check database connectivity and table access with timeout
+    # Check database connectivity with timeout
     try:
-        # Verify we can query the api_keys table (not just ping the database)
+        # SELECT 1 proves connectivity in constant time; counting a table
+        # would make probe latency grow with data volume
         # Use asyncio.wait_for to enforce a timeout on the health check query
         result = await asyncio.wait_for(
-            db.execute(select(func.count(APIKey.id))),
+            conn.execute(text("SELECT 1")),
             timeout=HEALTH_CHECK_TIMEOUT,
         )
         result.scalar()  # Ensure result is fetched
-        checks["database"] = "ok"
+        # Happy path: reuse the prebuilt response, no validation per probe
+        return _READY_OK
     except TimeoutError:
         logger.warning(
             "Database health check timed out",
             extra={"timeout_seconds": HEALTH_CHECK_TIMEOUT},
         )
-        checks["database"] = "timeout"
+        database_check = "timeout"
     except SQLAlchemyError as e:
         logger.warning("Database health check failed", extra={"error": str(e)})
-        checks["database"] = "error"
-
-    # Determine overall status
-    all_ok = all(v == "ok" for v in checks.values())
-    overall_status = "ok" if all_ok else "degraded"
+        database_check = "error"
 
     # Return 503 if not ready (Kubernetes expects this)
-    if not all_ok:
-        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
-
-    return ReadinessResponse(status=overall_status, checks=checks)
+    response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessResponse(status="degraded", checks={"database": database_check})
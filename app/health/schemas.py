@@ -1,17 +1,26 @@
 """Health check response schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# defer_build postpones core-schema compilation from import to first use;
+# frozen enables pydantic's cached-setattr fast path and these responses are
+# never mutated after construction
+_RESPONSE_CONFIG = ConfigDict(defer_build=True, frozen=True)
 
 
 class HealthResponse(BaseModel):
     """Response for liveness probe."""
 
+    model_config = _RESPONSE_CONFIG
+
     status: str = Field(..., description="Health status (ok, error)")
 
 
 class ReadinessResponse(BaseModel):
     """Response for readiness probe with dependency checks."""
 
+    model_config = _RESPONSE_CONFIG
+
     status: str = Field(..., description="Overall status (ok, degraded, error)")
     checks: dict[str, str] = Field(
         default_factory=dict,
@@ -2,7 +2,7 @@
 
 from uuid import uuid4
 
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,10 +13,20 @@ class Item(TimestampMixin, Base):
     """Example item model for CRUD operations."""
 
     __tablename__ = "items"
+    __table_args__ = (
+        # Serves keyset pagination on (created_at, id); Postgres scans it
+        # backward for the DESC ordering, so no DESC index is needed
+        Index("ix_items_created_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
+        # ORM/Core inserts always apply the Python default (SQLAlchemy sends
+        # it whenever one is set), so SQLite tests work and code can read
+        # the id before flush; the server default only covers writers that
+        # bypass SQLAlchemy (raw SQL, bulk COPY)
+        server_default=func.gen_random_uuid(),
         default=lambda: str(uuid4()),
     )
     name: Mapped[str] = mapped_column(
@@ -1,9 +1,14 @@
 """Item API endpoints."""
 
+import base64
+import binascii
+import json
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import RequireAPIKey
@@ -13,6 +18,28 @@ from app.items.service import ItemService
 
 router = APIRouter(prefix="/items", tags=["items"])
 
+# Built once; validates a whole page of rows in a single pydantic-core call
+# instead of one model_validate per row
+_item_list_adapter: TypeAdapter[list[ItemResponse]] = TypeAdapter(list[ItemResponse])
+
+
+def _encode_cursor(key: tuple[datetime, str]) -> str:
+    """Serialize a (created_at, id) page key as an opaque URL-safe cursor."""
+    raw = json.dumps([key[0].isoformat(), key[1]]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Parse a client-supplied cursor, rejecting anything malformed."""
+    try:
+        created_at_raw, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at_raw), str(item_id)
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from exc
+
 
 @router.post(
     "",
@@ -40,14 +67,39 @@ async def list_items(
     _api_key: RequireAPIKey,
     skip: int = Query(0, ge=0, le=1000, description="Number of items to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum items to return"),
+    cursor: str | None = Query(
+        None,
+        description="Cursor from a previous page; takes precedence over skip",
+    ),
 ) -> ItemList:
-    """List all items with pagination."""
-    items, total = await ItemService.get_all(db, skip=skip, limit=limit)
+    """List all items with pagination.
+
+    Pages are fetched with keyset pagination when a cursor is supplied (or
+    for the first page): follow next_cursor from each response and every page
+    costs the same regardless of depth. skip remains for offset access but
+    its cost grows with the offset. total is the full collection count on
+    both paths.
+    """
+    if cursor is not None or skip == 0:
+        after = _decode_cursor(cursor) if cursor is not None else None
+        items, total, next_key = await ItemService.get_page(
+            db, limit=limit, after=after
+        )
+        next_cursor = _encode_cursor(next_key) if next_key is not None else None
+        skip = 0
+    else:
+        items, total = await ItemService.get_all(db, skip=skip, limit=limit)
+        next_cursor = (
+            _encode_cursor((items[-1].created_at, items[-1].id))
+            if len(items) == limit
+            else None
+        )
     return ItemList(
-        items=[ItemResponse.model_validate(item) for item in items],
+        items=_item_list_adapter.validate_python(items, from_attributes=True),
         total=total,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -44,7 +44,7 @@ class ItemUpdate(BaseModel):
 class ItemResponse(BaseModel):
     """Schema for item response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
     id: str
     name: str
@@ -56,7 +56,15 @@ class ItemResponse(BaseModel):
 class ItemList(BaseModel):
     """Schema for list of items with pagination info."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     items: list[ItemResponse]
-    total: int
+    total: int = Field(
+        description="Total number of items in the collection, on every page",
+    )
     skip: int
     limit: int
+    next_cursor: str | None = Field(
+        None,
+        description="Opaque cursor for the next page (null on the last page)",
+    )
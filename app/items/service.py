@@ -1,6 +1,8 @@
 """Item CRUD service."""
 
-from sqlalchemy import delete, func, select
+from datetime import datetime
+
+from sqlalchemy import Select, and_, delete, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.items.models import Item
@@ -10,6 +12,16 @@ from app.items.schemas import ItemCreate, ItemUpdate
 class ItemService:
     """Service class for item CRUD operations."""
 
+    @staticmethod
+    def _base_select() -> Select[tuple[Item]]:
+        """Base SELECT shared by every item read path.
+
+        A passthrough today; when Item grows relationships, eager-loader
+        options (selectinload) go here once instead of in each query, so
+        list/detail endpoints never regress into N+1 loads.
+        """
+        return select(Item)
+
     @staticmethod
     async def create(db: AsyncSession, data: ItemCreate) -> Item:
         """Create a new item.
@@ -21,11 +33,13 @@ class ItemService:
         Returns:
             The created item.
         """
-        item = Item(**data.model_dump())
-        db.add(item)
-        await db.flush()
-        await db.refresh(item)
-        return item
+        # INSERT ... RETURNING brings back server defaults (id, timestamps)
+        # with the insert itself, replacing the flush + refresh pair and its
+        # extra SELECT round trip
+        result = await db.execute(
+            insert(Item).values(**data.model_dump()).returning(Item)
+        )
+        return result.scalar_one()
 
     @staticmethod
     async def get_by_id(db: AsyncSession, item_id: str) -> Item | None:
@@ -38,7 +52,7 @@ class ItemService:
         Returns:
             The item if found, None otherwise.
         """
-        result = await db.execute(select(Item).where(Item.id == item_id))
+        result = await db.execute(ItemService._base_select().where(Item.id == item_id))
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -57,17 +71,92 @@ class ItemService:
         Returns:
             A tuple of (list of items, total count).
         """
-        # Get total count
-        count_result = await db.execute(select(func.count(Item.id)))
-        total = count_result.scalar() or 0
-
-        # Get paginated results
+        # count(*) OVER () attaches the unpaginated total to every row, so
+        # one round trip returns both the page and the count. The id
+        # tiebreaker matches get_page's sort key: the router builds a cursor
+        # from this page's last row, and rows tying on created_at must sit in
+        # the same total order on both paths or the crossover skips/repeats
         result = await db.execute(
-            select(Item).order_by(Item.created_at.desc()).offset(skip).limit(limit)
+            ItemService._base_select()
+            .add_columns(func.count().over().label("total"))
+            .order_by(Item.created_at.desc(), Item.id.desc())
+            .offset(skip)
+            .limit(limit)
         )
-        items = list(result.scalars().all())
+        # Unpack rows in a single pass instead of buffering them with .all()
+        # and copying into a second list; total is identical on every row
+        items: list[Item] = []
+        total = 0
+        for item, total in result:  # noqa: B007 - total carries out of the loop
+            items.append(item)
+        if items:
+            return items, total
+
+        # Empty page: either the table is empty or skip ran past the end;
+        # only then is a separate count needed
+        count_result = await db.execute(select(func.count(Item.id)))
+        return [], count_result.scalar() or 0
 
-        return items, total
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        limit: int = 50,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[list[Item], int, tuple[datetime, str] | None]:
+        """Get a keyset-paginated page of items.
+
+        Unlike OFFSET pagination, seeking past the (created_at, id) key of
+        the previous page is an indexed range scan whose cost stays O(limit)
+        at any page depth.
+
+        Args:
+            db: The database session.
+            limit: Maximum number of records to return.
+            after: (created_at, id) key of the last row of the previous page.
+
+        Returns:
+            A tuple of (items, total count, key of the last returned row or
+            None when this is the final page).
+        """
+        # A correlated-free scalar subquery carries the full table count on
+        # every row; unlike count(*) OVER (), it is not narrowed by the
+        # cursor predicate, so total stays stable as a client pages through
+        # (matching what the offset path reports)
+        total_col = select(func.count(Item.id)).scalar_subquery().label("total")
+        # Fetch one extra row to learn whether another page exists
+        stmt = (
+            ItemService._base_select()
+            .add_columns(total_col)
+            .order_by(Item.created_at.desc(), Item.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            # Expanded (created_at, id) < (:ca, :id) row comparison; the
+            # explicit form binds each value with its column type, which the
+            # row-value syntax gets wrong on SQLite
+            created_after, id_after = after
+            stmt = stmt.where(
+                or_(
+                    Item.created_at < created_after,
+                    and_(Item.created_at == created_after, Item.id < id_after),
+                )
+            )
+
+        result = await db.execute(stmt)
+        rows = result.all()
+        if not rows:
+            # Cursor ran past the end; only then is a separate count needed
+            count_result = await db.execute(select(func.count(Item.id)))
+            return [], count_result.scalar() or 0, None
+
+        total = rows[0].total
+        items = [row.Item for row in rows]
+        next_key: tuple[datetime, str] | None = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_key = (last.created_at, last.id)
+        return items, total, next_key
 
     # Allowed fields for update - prevents mass assignment vulnerabilities
     _UPDATABLE_FIELDS = frozenset({"name", "description"})
@@ -88,23 +177,24 @@ class ItemService:
         Returns:
             The updated item if found, None otherwise.
         """
-        item = await ItemService.get_by_id(db, item_id)
-        if not item:
-            return None
-
-        # Use explicit field mapping to prevent mass assignment vulnerabilities
-        update_data = data.model_dump(exclude_unset=True)
-        if "name" in update_data and "name" in ItemService._UPDATABLE_FIELDS:
-            item.name = update_data["name"]
-        if (
-            "description" in update_data
-            and "description" in ItemService._UPDATABLE_FIELDS
-        ):
-            item.description = update_data["description"]
-
-        await db.flush()
-        await db.refresh(item)
-        return item
+        # Intersect the explicitly-provided fields with the allowlist
+        # (prevents mass assignment); reading attributes directly skips the
+        # dict-building serialization pass of model_dump
+        values = {
+            field: getattr(data, field)
+            for field in data.model_fields_set & ItemService._UPDATABLE_FIELDS
+        }
+        if not values:
+            # Nothing to change; a plain fetch preserves the found/not-found
+            # contract
+            return await ItemService.get_by_id(db, item_id)
+
+        # UPDATE ... RETURNING folds the old select/flush/refresh sequence
+        # (three round trips) into one statement
+        result = await db.execute(
+            update(Item).where(Item.id == item_id).values(**values).returning(Item)
+        )
+        return result.scalar_one_or_none()
 
     @staticmethod
     async def delete(db: AsyncSession, item_id: str) -> bool:
@@ -1,16 +1,17 @@
 """FastAPI application entry point."""
 
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from functools import cache
 from importlib.metadata import PackageNotFoundError, version as get_version
 from typing import ClassVar
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config.settings import get_settings
 from app.core.exceptions import APIError
@@ -18,6 +19,7 @@ from app.core.logging import setup_logging
 from app.core.middleware import (
     CorrelationIdMiddleware,
     RequestLoggingMiddleware,
+    correlation_headers_var,
     correlation_id_var,
 )
 from app.db.session import get_engine
@@ -25,14 +27,28 @@ from app.health.router import router as health_router
 from app.items.router import router as items_router
 
 
+@cache
 def get_app_version() -> str:
-    """Get application version from package metadata."""
+    """Get application version from package metadata (cached)."""
     try:
         return get_version("my-project")
     except PackageNotFoundError:
         return "0.0.0-dev"
 
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson's C serializer.
+
+    default=str stringifies anything orjson can't encode natively (UUIDs,
+    exception ctx objects in validation errors, ...), so handlers can pass
+    payloads through without pre-sanitizing them.
+    """
+
+    def render(self, content: object) -> bytes:
+        """Serialize the response content to JSON bytes."""
+        return orjson.dumps(content, default=str)
+
+
 # OpenAPI tags for documentation
 OPENAPI_TAGS = [
     {
@@ -49,32 +65,46 @@ OPENAPI_TAGS = [
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan handler for startup and shutdown."""
+    import asyncio
     import logging
 
     from sqlalchemy import text
 
+    from app.auth.last_used_tracker import last_used_tracker
     from app.db.session import get_session_factory
 
     logger = logging.getLogger(__name__)
 
     # Startup
     settings = get_settings()
-    setup_logging(settings.log_level)
+
+    async def check_db() -> None:
+        """Verify database connectivity at startup."""
+        try:
+            async with get_session_factory()() as session:
+                await session.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.error("Database connectivity check failed: %s", e)
+            raise RuntimeError("Cannot connect to database") from e
+
+    # Logging setup is sync CPU work and the connectivity probe is pure I/O,
+    # so they run concurrently; further startup tasks can join the gather so
+    # readiness is bounded by the slowest task, not the sum
+    await asyncio.gather(
+        asyncio.to_thread(setup_logging, settings.log_level),
+        check_db(),
+    )
     logger.info("Application starting up")
+    logger.info("Database connectivity verified")
 
-    # Verify database connectivity at startup
-    try:
-        async with get_session_factory()() as session:
-            await session.execute(text("SELECT 1"))
-        logger.info("Database connectivity verified")
-    except Exception as e:
-        logger.error("Database connectivity check failed: %s", e)
-        raise RuntimeError("Cannot connect to database") from e
+    # Start the background worker that batches last_used_at updates
+    last_used_tracker.start()
 
     yield
 
     # Shutdown
     logger.info("Application shutting down")
+    await last_used_tracker.stop()
     try:
         await get_engine().dispose()
         logger.info("Database engine disposed successfully")
@@ -82,72 +112,187 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger.error("Error disposing database engine: %s", e)
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers to all responses."""
+# Security headers as pre-encoded ASGI pairs, built once at import; two
+# complete lists so a response takes a single list.extend with no
+# per-request encoding or concatenation
+_STATIC_SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+]
+
+# Relaxed CSP for docs endpoints to allow Swagger UI assets
+_DOCS_CSP = (
+    b"default-src 'self'; "
+    b"script-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
+    b"style-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
+    b"img-src 'self' data: https://cdn.jsdelivr.net https://fastapi.tiangolo.com; "
+    b"frame-ancestors 'none'"
+)
+_DEFAULT_CSP = (
+    b"default-src 'self'; "
+    b"script-src 'self'; "
+    b"style-src 'self'; "
+    b"img-src 'self' data:; "
+    b"frame-ancestors 'none'"
+)
+
+_SECURITY_HEADERS = [
+    *_STATIC_SECURITY_HEADERS,
+    (b"content-security-policy", _DEFAULT_CSP),
+]
+_DOCS_SECURITY_HEADERS = [
+    *_STATIC_SECURITY_HEADERS,
+    (b"content-security-policy", _DOCS_CSP),
+]
+
+
+class SecurityHeadersMiddleware:
+    """Middleware to add security headers to all responses.
+
+    Pure ASGI rather than BaseHTTPMiddleware, which spawns an anyio task
+    group and streams the body through memory channels per request; the
+    headers are appended in a plain send wrapper instead.
+    """
 
     # Paths that need relaxed CSP for external resources (Swagger UI)
     DOCS_PATHS: ClassVar[set[str]] = {"/docs", "/redoc", "/openapi.json"}
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add security headers to the response."""
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        # Use relaxed CSP for docs endpoints to allow Swagger UI assets
-        if request.url.path in self.DOCS_PATHS:
-            response.headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
-                "style-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
-                "img-src 'self' data: https://cdn.jsdelivr.net https://fastapi.tiangolo.com; "
-                "frame-ancestors 'none'"
-            )
-        else:
-            response.headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self'; "
-                "style-src 'self'; "
-                "img-src 'self' data:; "
-                "frame-ancestors 'none'"
-            )
-        return response
-
-
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware to limit request body size."""
-
-    def __init__(self, app: object, max_size: int) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        security_headers = (
+            _DOCS_SECURITY_HEADERS
+            if scope["path"] in self.DOCS_PATHS
+            else _SECURITY_HEADERS
+        )
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", []).extend(security_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class RequestSizeLimitMiddleware:
+    """Middleware to limit request body size.
+
+    Pure ASGI for the same reason as SecurityHeadersMiddleware; the
+    Content-Length check reads scope["headers"] directly.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int) -> None:
         """Initialize with max request size in bytes."""
-        super().__init__(app)  # type: ignore[arg-type]
+        self.app = app
         self.max_size = max_size
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Check request size before processing."""
-        content_length = request.headers.get("content-length")
-        if content_length:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Safe methods carry no body worth limiting; skip the header scan
+        if scope["method"] in ("GET", "HEAD", "OPTIONS"):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = value
+                break
+
+        if content_length is not None:
             try:
-                if int(content_length) > self.max_size:
-                    return JSONResponse(
-                        status_code=413,
-                        content={"detail": "Request body too large"},
-                    )
+                too_large = int(content_length) > self.max_size
             except ValueError:
-                return JSONResponse(
+                response = ORJSONResponse(
                     status_code=400,
                     content={"detail": "Invalid Content-Length header"},
                 )
-        return await call_next(request)
+                await response(scope, receive, send)
+                return
+            if too_large:
+                response = ORJSONResponse(
+                    status_code=413,
+                    content={"detail": "Request body too large"},
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+
+async def api_error_handler(request: Request, exc: APIError) -> ORJSONResponse:
+    """Handle custom API errors with correlation ID for debugging."""
+    correlation_id = correlation_id_var.get()
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={
+            "detail": exc.message,
+            "error": type(exc).__name__,
+            "correlation_id": correlation_id,
+            **exc.details,
+        },
+        headers=correlation_headers_var.get(),
+    )
+
+
+async def validation_error_handler(
+    request: Request, exc: RequestValidationError
+) -> ORJSONResponse:
+    """Handle Pydantic validation errors with correlation ID."""
+    correlation_id = correlation_id_var.get()
+    # No per-error sanitizing pass: ORJSONResponse's default=str handles
+    # non-serializable ctx objects
+    return ORJSONResponse(
+        status_code=422,
+        content={
+            "detail": exc.errors(),
+            "error": "ValidationError",
+            "correlation_id": correlation_id,
+        },
+        headers=correlation_headers_var.get(),
+    )
+
+
+async def generic_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Handle unhandled exceptions with correlation ID for debugging."""
+    import logging
+
+    logger = logging.getLogger(__name__)
+    correlation_id = correlation_id_var.get()
+    logger.exception(
+        "Unhandled exception",
+        extra={"correlation_id": correlation_id, "path": request.url.path},
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "detail": "Internal server error",
+            "error": "InternalServerError",
+            "correlation_id": correlation_id,
+        },
+        headers=correlation_headers_var.get(),
+    )
+
+
+# Passed to FastAPI() at construction; add_exception_handler calls after the
+# app exists would each invalidate and rebuild the middleware stack
+_EXCEPTION_HANDLERS = {
+    APIError: api_error_handler,
+    RequestValidationError: validation_error_handler,
+    Exception: generic_exception_handler,
+}
 
 
 def create_app() -> FastAPI:
@@ -168,10 +313,15 @@ def create_app() -> FastAPI:
         redoc_url=redoc_url,
         openapi_url=openapi_url,
         openapi_tags=OPENAPI_TAGS,
+        default_response_class=ORJSONResponse,
+        exception_handlers=_EXCEPTION_HANDLERS,  # type: ignore[arg-type]
     )
 
-    # Add CORS middleware only if origins are configured
+    # Add CORS middleware only if origins are configured; same-origin
+    # deployments leave cors_origins empty and skip the middleware entirely
     if settings.cors_origins:
+        # Plain sequences: CORSMiddleware normalizes these itself (SET-like
+        # structures gain nothing) and its signature expects Sequence[str]
         app.add_middleware(
             CORSMiddleware,
             allow_origins=settings.cors_origins,
@@ -190,82 +340,12 @@ def create_app() -> FastAPI:
     app.add_middleware(RequestSizeLimitMiddleware, max_size=settings.max_request_size)
     app.add_middleware(SecurityHeadersMiddleware)
     app.add_middleware(
-        RequestLoggingMiddleware, expose_timing=settings.expose_timing_header
+        RequestLoggingMiddleware,
+        expose_timing=settings.expose_timing_header,
+        fast_log=settings.request_log_fast_path,
     )
     app.add_middleware(CorrelationIdMiddleware)
 
-    # Register exception handlers
-    async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
-        """Handle custom API errors with correlation ID for debugging."""
-        correlation_id = correlation_id_var.get()
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "detail": exc.message,
-                "error": type(exc).__name__,
-                "correlation_id": correlation_id,
-                **exc.details,
-            },
-            headers={"X-Correlation-ID": correlation_id} if correlation_id else None,
-        )
-
-    async def validation_error_handler(
-        request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
-        """Handle Pydantic validation errors with correlation ID."""
-        correlation_id = correlation_id_var.get()
-        # Convert errors to JSON-serializable format (ctx may contain non-serializable objects)
-        errors = []
-        for error in exc.errors():
-            clean_error = {
-                "type": error.get("type"),
-                "loc": error.get("loc"),
-                "msg": error.get("msg"),
-                "input": error.get("input"),
-            }
-            errors.append(clean_error)
-        return JSONResponse(
-            status_code=422,
-            content={
-                "detail": errors,
-                "error": "ValidationError",
-                "correlation_id": correlation_id,
-            },
-            headers={"X-Correlation-ID": correlation_id} if correlation_id else None,
-        )
-
-    async def generic_exception_handler(
-        request: Request, exc: Exception
-    ) -> JSONResponse:
-        """Handle unhandled exceptions with correlation ID for debugging."""
-        import logging
-
-        logger = logging.getLogger(__name__)
-        correlation_id = correlation_id_var.get()
-        logger.exception(
-            "Unhandled exception",
-            extra={"correlation_id": correlation_id, "path": request.url.path},
-        )
-        return JSONResponse(
-            status_code=500,
-            content={
-                "detail": "Internal server error",
-                "error": "InternalServerError",
-                "correlation_id": correlation_id,
-            },
-            headers={"X-Correlation-ID": correlation_id} if correlation_id else None,
-        )
-
-    app.add_exception_handler(APIError, api_error_handler)  # type: ignore[arg-type]
-    app.add_exception_handler(
-        RequestValidationError,
-        validation_error_handler,  # pyright: ignore[reportArgumentType]
-    )
-    app.add_exception_handler(
-        Exception,
-        generic_exception_handler,  # pyright: ignore[reportArgumentType]
-    )
-
     # Include routers
     app.include_router(health_router)
     app.include_router(items_router, prefix="/api/v1")
@@ -290,12 +370,24 @@ def main() -> None:
     """Run the application using uvicorn."""
     import uvicorn
 
+    # uvicorn[standard] ships uvloop and httptools; request explicitly so a
+    # broken install fails loudly instead of silently falling back to the
+    # slower selector loop. uvloop is unavailable on Windows, hence the probe.
+    try:
+        import uvloop  # noqa: F401
+
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+
     settings = get_settings()
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        loop=loop_impl,
+        http="httptools",
     )
 
 
@@ -0,0 +1,73 @@
+"""Minimal in-process ASGI driver for tests.
+
+For tests that only assert a status code and a few headers, the full
+httpx -> ASGITransport -> response-parsing stack is overhead; this calls
+the application callable directly with a hand-built scope.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from starlette.types import ASGIApp, Message
+
+
+async def raw_request(
+    app: ASGIApp,
+    method: str,
+    path: str,
+    body: bytes = b"",
+    headers: Iterable[tuple[bytes, bytes]] = (),
+) -> tuple[int, dict[str, str], bytes]:
+    """Drive one HTTP request through ``app`` without an HTTP client.
+
+    Args:
+        app: The ASGI application callable.
+        method: HTTP method.
+        path: Request path.
+        body: Request body bytes.
+        headers: Raw ASGI header pairs.
+
+    Returns:
+        A tuple of (status code, lowercased header dict, body bytes).
+    """
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": list(headers),
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+
+    body_sent = False
+
+    async def receive() -> Message:
+        nonlocal body_sent
+        if body_sent:
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status = 0
+    response_headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for name, value in message.get("headers", []):
+                response_headers[name.decode("latin-1").lower()] = value.decode(
+                    "latin-1"
+                )
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(chunks)
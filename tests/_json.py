@@ -0,0 +1,17 @@
+"""Request-body encoding helper for tests.
+
+httpx's ``json=`` kwarg serializes with stdlib ``json.dumps`` per request;
+``jbody`` pre-encodes with orjson (the same serializer the app responds
+with) and hands httpx ready bytes instead.
+"""
+
+from typing import Any
+
+import orjson
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def jbody(data: Any) -> dict[str, Any]:
+    """Keyword arguments for an httpx request carrying ``data`` as JSON."""
+    return {"content": orjson.dumps(data), "headers": _JSON_HEADERS}
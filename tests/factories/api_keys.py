@@ -2,11 +2,8 @@
 
 from typing import Any
 
-from faker import Faker
-
 from app.auth.schemas import APIKeyCreate
-
-fake = Faker()
+from tests.factories._faker import company_name, get_fake
 
 
 class APIKeyFactory:
@@ -23,8 +20,8 @@ class APIKeyFactory:
             APIKeyCreate schema with test data.
         """
         data: dict[str, Any] = {
-            "name": f"{fake.company()} API Key",
-            "client_id": fake.uuid4(),
+            "name": f"{company_name()} API Key",
+            "client_id": get_fake().uuid4(),
         }
         data.update(overrides)
         return APIKeyCreate(**data)
@@ -2,32 +2,57 @@
 
 from typing import Any
 
-from faker import Faker
-
 from app.items.schemas import ItemCreate
-
-fake = Faker()
+from tests.factories._faker import short_paragraph, short_sentence
 
 
 class ItemFactory:
     """Factory for creating test item data."""
 
     @staticmethod
-    def create_data(**overrides: Any) -> ItemCreate:
-        """Create item creation data.
+    def create_dict(**overrides: Any) -> dict[str, Any]:
+        """Create item creation data as a plain wire-format dict.
+
+        Tests that only send the data over HTTP use this directly, skipping
+        the Pydantic model construction and model_dump round trip.
 
         Args:
             **overrides: Fields to override with specific values.
 
         Returns:
-            ItemCreate schema with test data.
+            Dict of item fields ready for a JSON request body.
         """
         data: dict[str, Any] = {
-            "name": fake.sentence(nb_words=3).rstrip("."),
-            "description": fake.paragraph(nb_sentences=2),
+            "name": short_sentence(),
+            "description": short_paragraph(),
         }
         data.update(overrides)
-        return ItemCreate(**data)
+        return data
+
+    @staticmethod
+    def create_batch_dicts(count: int = 3, **overrides: Any) -> list[dict[str, Any]]:
+        """Create multiple wire-format item dicts.
+
+        Args:
+            count: Number of items to create.
+            **overrides: Fields to override with specific values.
+
+        Returns:
+            List of dicts of item fields.
+        """
+        return [ItemFactory.create_dict(**overrides) for _ in range(count)]
+
+    @staticmethod
+    def create_data(**overrides: Any) -> ItemCreate:
+        """Create item creation data.
+
+        Args:
+            **overrides: Fields to override with specific values.
+
+        Returns:
+            ItemCreate schema with test data.
+        """
+        return ItemCreate(**ItemFactory.create_dict(**overrides))
 
     @staticmethod
     def create_batch_data(count: int = 3, **overrides: Any) -> list[ItemCreate]:
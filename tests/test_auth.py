@@ -4,6 +4,7 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.last_used_tracker import last_used_tracker
 from app.auth.models import APIKey
 from app.auth.service import APIKeyService
 
@@ -41,8 +42,12 @@ async def test_request_without_api_key(client: AsyncClient) -> None:
 @pytest.mark.asyncio
 async def test_request_with_invalid_api_key(client: AsyncClient) -> None:
     """Test that requests with invalid API key return 401."""
-    client.headers["X-API-Key"] = "sk_invalid_key_that_does_not_exist"
-    response = await client.get("/api/v1/items")
+    # Per-request header: the client is shared session-wide, so mutating
+    # client.headers would leak the key into later tests on this worker
+    response = await client.get(
+        "/api/v1/items",
+        headers={"X-API-Key": "sk_invalid_key_that_does_not_exist"},
+    )
 
     assert response.status_code == 401
 
@@ -69,12 +74,44 @@ async def test_api_key_last_used_updated(
     # Make a request
     await authenticated_client.get("/api/v1/items")
 
+    # Usage is batched by the tracker; flush it explicitly instead of
+    # waiting for the background worker
+    await last_used_tracker.flush(db_session)
+
     # Refresh the key from database
     await db_session.refresh(api_key)
 
     assert api_key.last_used_at is not None
 
 
+@pytest.mark.asyncio
+async def test_get_key_by_prefix_or_id(
+    db_session: AsyncSession,
+    test_api_key: tuple[str, APIKey],
+) -> None:
+    """Test resolving a key by full prefix, by ID, and by partial prefix."""
+    _, api_key = test_api_key
+
+    by_prefix = await APIKeyService.get_key_by_prefix_or_id(
+        db_session, api_key.key_prefix
+    )
+    assert by_prefix is not None
+    assert by_prefix.id == api_key.id
+
+    by_id = await APIKeyService.get_key_by_prefix_or_id(db_session, api_key.id)
+    assert by_id is not None
+    assert by_id.id == api_key.id
+
+    by_partial = await APIKeyService.get_key_by_prefix_or_id(
+        db_session, api_key.key_prefix[:6]
+    )
+    assert by_partial is not None
+    assert by_partial.id == api_key.id
+
+    missing = await APIKeyService.get_key_by_prefix_or_id(db_session, "sk_nosuchkey")
+    assert missing is None
+
+
 @pytest.mark.asyncio
 async def test_revoked_api_key_rejected(
     client: AsyncClient,
@@ -88,8 +125,8 @@ async def test_revoked_api_key_rejected(
     await APIKeyService.revoke_key(db_session, api_key.id)
     await db_session.commit()
 
-    # Try to use the revoked key
-    client.headers["X-API-Key"] = raw_key
-    response = await client.get("/api/v1/items")
+    # Try to use the revoked key (per-request header; the shared client's
+    # header table must stay untouched)
+    response = await client.get("/api/v1/items", headers={"X-API-Key": raw_key})
 
     assert response.status_code == 401
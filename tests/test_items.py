@@ -1,25 +1,44 @@
 """Tests for items CRUD endpoints."""
 
+from collections.abc import Awaitable, Callable
+
 import pytest
 from httpx import AsyncClient
 
+from app.items.models import Item
+from tests._json import jbody
 from tests.factories.items import ItemFactory
 
+# Keep this module on one xdist worker (see pyproject: --dist loadgroup)
+pytestmark = pytest.mark.xdist_group("items")
+
+# Canonical well-formed UUID that never matches a row
+MISSING_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+@pytest.fixture(scope="module")
+def sample_item_dict() -> dict[str, str]:
+    """One canonical item payload, built once per module."""
+    return ItemFactory.create_dict()
+
 
 @pytest.mark.asyncio
-async def test_create_item(authenticated_client: AsyncClient) -> None:
+async def test_create_item(
+    authenticated_client: AsyncClient,
+    sample_item_dict: dict[str, str],
+) -> None:
     """Test creating a new item."""
-    data = ItemFactory.create_data()
+    data = sample_item_dict
 
     response = await authenticated_client.post(
         "/api/v1/items",
-        json=data.model_dump(),
+        **jbody(data),
     )
 
     assert response.status_code == 201
     result = response.json()
-    assert result["name"] == data.name
-    assert result["description"] == data.description
+    assert result["name"] == data["name"]
+    assert result["description"] == data["description"]
     assert "id" in result
     assert "created_at" in result
 
@@ -29,7 +48,7 @@ async def test_create_item_minimal(authenticated_client: AsyncClient) -> None:
     """Test creating an item with only required fields."""
     response = await authenticated_client.post(
         "/api/v1/items",
-        json={"name": "Minimal Item"},
+        **jbody({"name": "Minimal Item"}),
     )
 
     assert response.status_code == 201
@@ -50,11 +69,13 @@ async def test_list_items_empty(authenticated_client: AsyncClient) -> None:
 
 
 @pytest.mark.asyncio
-async def test_list_items_with_data(authenticated_client: AsyncClient) -> None:
+async def test_list_items_with_data(
+    authenticated_client: AsyncClient,
+    seed_items: Callable[[int], Awaitable[list[Item]]],
+) -> None:
     """Test listing items after creating some."""
-    # Create items
-    for data in ItemFactory.create_batch_data(3):
-        await authenticated_client.post("/api/v1/items", json=data.model_dump())
+    # Seed straight through the session: one flush instead of 3 POSTs
+    await seed_items(3)
 
     response = await authenticated_client.get("/api/v1/items")
 
@@ -65,11 +86,12 @@ async def test_list_items_with_data(authenticated_client: AsyncClient) -> None:
 
 
 @pytest.mark.asyncio
-async def test_list_items_pagination(authenticated_client: AsyncClient) -> None:
+async def test_list_items_pagination(
+    authenticated_client: AsyncClient,
+    seed_items: Callable[[int], Awaitable[list[Item]]],
+) -> None:
     """Test listing items with pagination."""
-    # Create 5 items
-    for data in ItemFactory.create_batch_data(5):
-        await authenticated_client.post("/api/v1/items", json=data.model_dump())
+    await seed_items(5)
 
     # Get first page
     response = await authenticated_client.get("/api/v1/items?skip=0&limit=2")
@@ -83,80 +105,75 @@ async def test_list_items_pagination(authenticated_client: AsyncClient) -> None:
 
 
 @pytest.mark.asyncio
-async def test_get_item(authenticated_client: AsyncClient) -> None:
-    """Test getting a single item by ID."""
-    # Create an item
-    data = ItemFactory.create_data(name="Test Item")
-    create_response = await authenticated_client.post(
-        "/api/v1/items",
-        json=data.model_dump(),
-    )
-    item_id = create_response.json()["id"]
-
-    # Get the item
-    response = await authenticated_client.get(f"/api/v1/items/{item_id}")
-
+async def test_list_items_cursor_pagination(
+    authenticated_client: AsyncClient,
+    seed_items: Callable[[int], Awaitable[list[Item]]],
+) -> None:
+    """Test walking pages via next_cursor until exhausted."""
+    await seed_items(5)
+
+    # First page carries a cursor to the next one
+    response = await authenticated_client.get("/api/v1/items?limit=2")
     assert response.status_code == 200
     result = response.json()
-    assert result["id"] == item_id
-    assert result["name"] == "Test Item"
+    assert len(result["items"]) == 2
+    assert result["total"] == 5
+    assert result["next_cursor"] is not None
+    seen = {item["id"] for item in result["items"]}
+
+    # Follow cursors; pages must not overlap and total stays the full count
+    while result["next_cursor"]:
+        response = await authenticated_client.get(
+            f"/api/v1/items?limit=2&cursor={result['next_cursor']}"
+        )
+        assert response.status_code == 200
+        result = response.json()
+        assert result["total"] == 5
+        page_ids = {item["id"] for item in result["items"]}
+        assert not (seen & page_ids)
+        seen |= page_ids
+
+    assert len(seen) == 5
 
 
 @pytest.mark.asyncio
-async def test_get_item_not_found(authenticated_client: AsyncClient) -> None:
-    """Test getting a non-existent item returns 404."""
-    response = await authenticated_client.get(
-        "/api/v1/items/00000000-0000-0000-0000-000000000000"
-    )
+async def test_list_items_invalid_cursor(authenticated_client: AsyncClient) -> None:
+    """Test that a malformed cursor is rejected."""
+    response = await authenticated_client.get("/api/v1/items?cursor=not-a-cursor")
 
-    assert response.status_code == 404
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
 
 
 @pytest.mark.asyncio
-async def test_update_item(authenticated_client: AsyncClient) -> None:
-    """Test updating an item."""
-    # Create an item
-    data = ItemFactory.create_data(name="Original Name")
+async def test_item_lifecycle(authenticated_client: AsyncClient) -> None:
+    """Test the full item flow: create, get, update, delete, 404 after."""
+    # Create an item once and reuse it for every stage
+    data = ItemFactory.create_dict(name="Original Name")
     create_response = await authenticated_client.post(
         "/api/v1/items",
-        json=data.model_dump(),
+        **jbody(data),
     )
+    assert create_response.status_code == 201
     item_id = create_response.json()["id"]
 
+    # Get the item
+    response = await authenticated_client.get(f"/api/v1/items/{item_id}")
+    assert response.status_code == 200
+    result = response.json()
+    assert result["id"] == item_id
+    assert result["name"] == "Original Name"
+
     # Update the item
     response = await authenticated_client.patch(
         f"/api/v1/items/{item_id}",
-        json={"name": "Updated Name"},
+        **jbody({"name": "Updated Name"}),
     )
-
     assert response.status_code == 200
     result = response.json()
     assert result["name"] == "Updated Name"
     # Description should be unchanged
-    assert result["description"] == data.description
-
-
-@pytest.mark.asyncio
-async def test_update_item_not_found(authenticated_client: AsyncClient) -> None:
-    """Test updating a non-existent item returns 404."""
-    response = await authenticated_client.patch(
-        "/api/v1/items/00000000-0000-0000-0000-000000000000",
-        json={"name": "New Name"},
-    )
-
-    assert response.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_delete_item(authenticated_client: AsyncClient) -> None:
-    """Test deleting an item."""
-    # Create an item
-    data = ItemFactory.create_data()
-    create_response = await authenticated_client.post(
-        "/api/v1/items",
-        json=data.model_dump(),
-    )
-    item_id = create_response.json()["id"]
+    assert result["description"] == data["description"]
 
     # Delete the item
     response = await authenticated_client.delete(f"/api/v1/items/{item_id}")
@@ -168,10 +185,24 @@ async def test_delete_item(authenticated_client: AsyncClient) -> None:
 
 
 @pytest.mark.asyncio
-async def test_delete_item_not_found(authenticated_client: AsyncClient) -> None:
-    """Test deleting a non-existent item returns 404."""
-    response = await authenticated_client.delete(
-        "/api/v1/items/00000000-0000-0000-0000-000000000000"
+@pytest.mark.parametrize(
+    ("method", "json_body"),
+    [
+        ("GET", None),
+        ("PATCH", {"name": "New Name"}),
+        ("DELETE", None),
+    ],
+)
+async def test_item_not_found(
+    authenticated_client: AsyncClient,
+    method: str,
+    json_body: dict[str, str] | None,
+) -> None:
+    """Test that operations on a non-existent item return 404."""
+    response = await authenticated_client.request(
+        method,
+        f"/api/v1/items/{MISSING_UUID}",
+        json=json_body,
     )
 
     assert response.status_code == 404
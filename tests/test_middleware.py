@@ -1,48 +1,86 @@
 """Tests for middleware and exception handlers."""
 
+import re
+
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 
+from tests._asgi import raw_request
+
+# Keep this module on one xdist worker (see pyproject: --dist loadgroup)
+pytestmark = pytest.mark.xdist_group("middleware")
+
+# Canonical well-formed UUID that never matches a row
+MISSING_UUID = "00000000-0000-0000-0000-000000000000"
+
+# Numeric prefix of the X-Process-Time value (e.g. "0.42ms")
+_PROCESS_TIME_RE = re.compile(r"[0-9.]+")
+
+# Expected static security headers, checked in one pass
+_EXPECTED_SECURITY_HEADERS = {
+    "x-content-type-options": "nosniff",
+    "x-frame-options": "DENY",
+    "x-xss-protection": "1; mode=block",
+    "referrer-policy": "strict-origin-when-cross-origin",
+}
+
+
+@pytest_asyncio.fixture(scope="module")
+async def live_response() -> tuple[int, dict[str, str], bytes]:
+    """One GET /health/live shared by every header assertion in the module.
+
+    The endpoint touches no per-test state, so the four header tests can
+    split one round trip instead of making their own.
+    """
+    from app.main import app
+
+    return await raw_request(app, "GET", "/health/live")
+
 
 class TestSecurityHeadersMiddleware:
     """Tests for security headers middleware."""
 
-    @pytest.mark.asyncio
-    async def test_security_headers_present(self, client: AsyncClient) -> None:
+    def test_security_headers_present(
+        self, live_response: tuple[int, dict[str, str], bytes]
+    ) -> None:
         """Test that security headers are present in responses."""
-        response = await client.get("/health/live")
+        status, headers, _ = live_response
 
-        assert response.status_code == 200
-        assert response.headers.get("X-Content-Type-Options") == "nosniff"
-        assert response.headers.get("X-Frame-Options") == "DENY"
-        assert response.headers.get("X-XSS-Protection") == "1; mode=block"
-        assert (
-            response.headers.get("Referrer-Policy") == "strict-origin-when-cross-origin"
-        )
-        assert "Content-Security-Policy" in response.headers
+        assert status == 200
+        # Subset comparison checks the whole expected table in one pass
+        assert _EXPECTED_SECURITY_HEADERS.items() <= headers.items()
+        assert "content-security-policy" in headers
 
-    @pytest.mark.asyncio
-    async def test_csp_header_content(self, client: AsyncClient) -> None:
+    def test_csp_header_content(
+        self, live_response: tuple[int, dict[str, str], bytes]
+    ) -> None:
         """Test Content-Security-Policy header content."""
-        response = await client.get("/health/live")
-
-        csp = response.headers.get("Content-Security-Policy", "")
-        assert "default-src 'self'" in csp
-        assert "frame-ancestors 'none'" in csp
+        # Literal expected policy, not imported from the implementation:
+        # the test must fail if a directive is dropped or weakened
+        _, headers, _ = live_response
+
+        assert headers.get("content-security-policy") == (
+            "default-src 'self'; "
+            "script-src 'self'; "
+            "style-src 'self'; "
+            "img-src 'self' data:; "
+            "frame-ancestors 'none'"
+        )
 
 
 class TestCorrelationIdMiddleware:
     """Tests for correlation ID middleware."""
 
-    @pytest.mark.asyncio
-    async def test_correlation_id_in_response(self, client: AsyncClient) -> None:
+    def test_correlation_id_in_response(
+        self, live_response: tuple[int, dict[str, str], bytes]
+    ) -> None:
         """Test that correlation ID is returned in response headers."""
-        response = await client.get("/health/live")
+        status, headers, _ = live_response
 
-        assert response.status_code == 200
-        assert "X-Correlation-ID" in response.headers
-        correlation_id = response.headers["X-Correlation-ID"]
-        assert len(correlation_id) > 0
+        assert status == 200
+        assert "x-correlation-id" in headers
+        assert len(headers["x-correlation-id"]) > 0
 
     @pytest.mark.asyncio
     async def test_correlation_id_from_request(self, client: AsyncClient) -> None:
@@ -60,19 +98,18 @@ class TestCorrelationIdMiddleware:
 class TestRequestLoggingMiddleware:
     """Tests for request logging middleware."""
 
-    @pytest.mark.asyncio
-    async def test_process_time_header(self, client: AsyncClient) -> None:
+    def test_process_time_header(
+        self, live_response: tuple[int, dict[str, str], bytes]
+    ) -> None:
         """Test that X-Process-Time header is present."""
-        response = await client.get("/health/live")
+        status, headers, _ = live_response
 
-        assert response.status_code == 200
-        assert "X-Process-Time" in response.headers
-        # Process time may include 'ms' suffix
-        process_time_str = response.headers["X-Process-Time"]
-        # Remove 'ms' suffix if present
-        process_time_value = process_time_str.replace("ms", "").replace("s", "")
-        process_time = float(process_time_value)
-        assert process_time >= 0
+        assert status == 200
+        assert "x-process-time" in headers
+        # One scan for the numeric prefix instead of stacked replace() passes
+        match = _PROCESS_TIME_RE.search(headers["x-process-time"])
+        assert match is not None
+        assert float(match.group(0)) >= 0
 
 
 class TestValidationErrorHandler:
@@ -109,7 +146,9 @@ class TestValidationErrorHandler:
         )
 
         assert response.status_code == 422
-        assert "X-Correlation-ID" in response.headers
+        # Exactly one: the handler stamps the ID and the middleware must
+        # not append a duplicate
+        assert len(response.headers.get_list("X-Correlation-ID")) == 1
 
     @pytest.mark.asyncio
     async def test_whitespace_only_name_rejected(
@@ -123,8 +162,7 @@ class TestValidationErrorHandler:
         )
         # Should be 422 (validation error) - whitespace stripped becomes empty
         assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
+        assert b'"detail"' in response.content
 
 
 class TestAPIErrorHandler:
@@ -135,8 +173,8 @@ class TestAPIErrorHandler:
         """Test unauthorized error response format."""
         response = await client.get("/api/v1/items")
         assert response.status_code == 401
-        data = response.json()
-        assert "detail" in data
+        # C-level scan of the raw body; no need to parse the JSON
+        assert b'"detail"' in response.content
 
     @pytest.mark.asyncio
     async def test_not_found_error(
@@ -144,9 +182,7 @@ class TestAPIErrorHandler:
         authenticated_client: AsyncClient,
     ) -> None:
         """Test not found error response."""
-        response = await authenticated_client.get(
-            "/api/v1/items/00000000-0000-0000-0000-000000000000"
-        )
+        response = await authenticated_client.get(f"/api/v1/items/{MISSING_UUID}")
 
         assert response.status_code == 404
 
@@ -160,13 +196,12 @@ class TestRequestSizeLimitMiddleware:
         authenticated_client: AsyncClient,
     ) -> None:
         """Test that requests exceeding size limit are rejected."""
-        # Create a payload that would exceed typical limits
-        # Note: The actual limit check happens on Content-Length header
-        large_description = "x" * (11 * 1024 * 1024)  # 11MB
-
+        # The middleware rejects on the Content-Length header alone, so a
+        # tiny body with a spoofed header exercises the same path without
+        # materializing (and JSON-encoding) an 11MB string
         response = await authenticated_client.post(
             "/api/v1/items",
-            json={"name": "Test", "description": large_description},
+            json={"name": "Test", "description": "x"},
             headers={"Content-Length": str(11 * 1024 * 1024)},
         )
 
@@ -191,26 +226,23 @@ class TestUUIDValidation:
     """Tests for UUID path parameter validation."""
 
     @pytest.mark.asyncio
-    async def test_invalid_uuid_rejected(
-        self,
-        authenticated_client: AsyncClient,
-    ) -> None:
-        """Test that invalid UUIDs are rejected."""
-        response = await authenticated_client.get("/api/v1/items/not-a-valid-uuid")
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-
-    @pytest.mark.asyncio
-    async def test_valid_uuid_accepted(
+    @pytest.mark.parametrize(
+        ("item_id", "expected_status"),
+        [
+            # Malformed UUID fails path validation
+            ("not-a-valid-uuid", 422),
+            # Well-formed but absent UUID reaches the handler and 404s
+            ("12345678-1234-5678-1234-567812345678", 404),
+        ],
+    )
+    async def test_uuid_path_validation(
         self,
         authenticated_client: AsyncClient,
+        item_id: str,
+        expected_status: int,
     ) -> None:
-        """Test that valid UUIDs are accepted (even if item doesn't exist)."""
-        response = await authenticated_client.get(
-            "/api/v1/items/12345678-1234-5678-1234-567812345678"
-        )
+        """Test path-parameter UUID validation for bad and missing IDs."""
+        response = await authenticated_client.get(f"/api/v1/items/{item_id}")
 
-        # Should be 404 (not found), not 422 (validation error)
-        assert response.status_code == 404
+        assert response.status_code == expected_status
+        assert b'"detail"' in response.content